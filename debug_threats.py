@@ -1,6 +1,7 @@
 """Debug script to inspect threats.csv file for loading issues."""
 
 import csv
+import itertools
 from pathlib import Path
 
 
@@ -24,44 +25,34 @@ def debug_threats_csv():
     # Check text content with BOM handling
     print("\n📝 Text content inspection:")
     with open(threats_file, "r", encoding="utf-8-sig") as f:
-        lines = f.readlines()[:5]
-        for i, line in enumerate(lines):
+        for i, line in enumerate(itertools.islice(f, 5)):
             print(f"Line {i}: {repr(line)}")
 
     # Check CSV parsing
     print("\n🔍 CSV inspection:")
     try:
         with open(threats_file, "r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            print(f"Headers: {reader.fieldnames}")
-            print(f"Header types: {[(h, type(h)) for h in reader.fieldnames]}")
+            reader = csv.reader(f)
+            headers = next(reader, [])
+            print(f"Headers: {headers}")
 
             # Check for problematic headers
-            if reader.fieldnames:
-                for h in reader.fieldnames:
-                    if h is None:
-                        print("❌ Found None in headers!")
-                    elif not isinstance(h, str):
-                        print(f"❌ Non-string header: {h} (type: {type(h)})")
-                    elif h.strip() != h:
-                        print(f"⚠️  Header with whitespace: '{h}'")
+            for h in headers:
+                if not h.strip():
+                    print("❌ Found empty header!")
+                elif h.strip() != h:
+                    print(f"⚠️  Header with whitespace: '{h}'")
 
             # Check first few rows
-            for i, row in enumerate(reader):
+            for i, row in enumerate(itertools.islice(reader, 3)):
                 print(f"\nRow {i}:")
-                print(f"  Keys: {list(row.keys())}")
-                print(f"  Key types: {[(k, type(k)) for k in row.keys()]}")
-                print(f"  Values: {dict(row)}")
+                print(f"  Values: {dict(zip(headers, row))}")
 
-                # Check for problematic keys
-                for k in row.keys():
-                    if k is None:
-                        print(f"  ❌ None key found in row {i}")
-                    elif not isinstance(k, str):
-                        print(f"  ❌ Non-string key in row {i}: {k} (type: {type(k)})")
-
-                if i >= 2:  # Only check first 3 rows
-                    break
+                # Extra fields end up under a None key with csv.DictReader
+                if len(row) > len(headers):
+                    print(f"  ❌ Extra fields in row {i}: {row[len(headers) :]}")
+                elif len(row) < len(headers):
+                    print(f"  ⚠️  Missing fields in row {i}: {headers[len(row) :]}")
 
     except Exception as e:
         print(f"❌ CSV parsing error: {e}")
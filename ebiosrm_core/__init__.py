@@ -1,19 +1,22 @@
 """EBIOS Risk Manager core package."""
 
-__version__ = "2.0.0"
+from ._version import __version__ as __version__
+
 __author__ = "EBIOS Team"
 
-from .models import (
-    Asset,
-    Threat,
-    RiskSource,
-    TargetedObjective,
-    Stakeholder,
-    SecurityMeasure,
-    Settings,
-)
-from .loader import load_all
-from .generator import run
+# Public names are resolved on first access so that importing the package
+# (e.g. for the CLI) does not pull in pydantic, pandas or openpyxl.
+_LAZY = {
+    "Asset": ("ebiosrm_core.models", "Asset"),
+    "Threat": ("ebiosrm_core.models", "Threat"),
+    "RiskSource": ("ebiosrm_core.models", "RiskSource"),
+    "TargetedObjective": ("ebiosrm_core.models", "TargetedObjective"),
+    "Stakeholder": ("ebiosrm_core.models", "Stakeholder"),
+    "SecurityMeasure": ("ebiosrm_core.models", "SecurityMeasure"),
+    "Settings": ("ebiosrm_core.models", "Settings"),
+    "load_all": ("ebiosrm_core.loader", "load_all"),
+    "run": ("ebiosrm_core.generator", "run"),
+}
 
 __all__ = [
     "Asset",
@@ -26,3 +29,19 @@ __all__ = [
     "load_all",
     "run",
 ]
+
+
+def __getattr__(name):
+    """Import public names lazily (PEP 562)."""
+    if name in _LAZY:
+        import importlib
+
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
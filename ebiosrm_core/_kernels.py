@@ -0,0 +1,62 @@
+"""Numeric kernels for batched risk scoring.
+
+Large batches are JIT-compiled with Numba when it is installed; small batches,
+or runs without Numba, use equivalent NumPy code.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+# Below this many threats the NumPy path beats importing and running Numba.
+_NUMBA_MIN_SIZE = 10_000
+
+
+@lru_cache(maxsize=1)
+def _load_numba_kernels():
+    """Import the Numba kernels on first use, ``None`` when Numba is missing."""
+    try:
+        from . import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
+def _risk_codes_numpy(
+    likelihoods: np.ndarray, sev_idx: int, codes: np.ndarray
+) -> np.ndarray:
+    lik_idx = np.minimum(likelihoods.astype(np.int64) - 1, 3)
+    return codes[sev_idx][lik_idx]
+
+
+def _step_means_numpy(step_codes: np.ndarray) -> np.ndarray:
+    valid = step_codes >= 0
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, step_codes, 0).sum(axis=1, dtype=np.int64)
+    return np.where(counts > 0, sums / np.maximum(counts, 1), 1.0)
+
+
+def risk_codes(likelihoods: np.ndarray, sev_idx: int, codes: np.ndarray) -> np.ndarray:
+    """Look up the risk level code of every likelihood in one severity row.
+
+    ``codes`` is the risk matrix as integer level codes, severity (rows) x
+    likelihood (cols); ``sev_idx`` selects the row shared by all threats.
+    """
+    if likelihoods.size >= _NUMBA_MIN_SIZE:
+        kernels = _load_numba_kernels()
+        if kernels is not None:
+            return kernels._risk_codes_numba(likelihoods, sev_idx, codes)
+    return _risk_codes_numpy(likelihoods, sev_idx, codes)
+
+
+def step_means(step_codes: np.ndarray) -> np.ndarray:
+    """Average the step scores of each row, 1.0 for rows without steps.
+
+    ``step_codes`` holds one threat per row, padded with -1 after its last
+    step score.
+    """
+    if step_codes.shape[0] >= _NUMBA_MIN_SIZE:
+        kernels = _load_numba_kernels()
+        if kernels is not None:
+            return kernels._step_means_numba(step_codes)
+    return _step_means_numpy(step_codes)
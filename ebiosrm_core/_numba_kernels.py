@@ -0,0 +1,30 @@
+"""Numba JIT versions of the kernels in :mod:`._kernels`.
+
+Importing this module imports Numba, so it is only loaded on demand by the
+dispatchers once a batch is large enough to amortise the start-up cost.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def _risk_codes_numba(likelihoods, sev_idx, codes):
+    out = np.empty(likelihoods.size, dtype=codes.dtype)
+    for i in prange(likelihoods.size):
+        out[i] = codes[sev_idx, min(int(likelihoods[i]) - 1, 3)]
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _step_means_numba(step_codes):
+    out = np.empty(step_codes.shape[0], dtype=np.float64)
+    for i in prange(step_codes.shape[0]):
+        total = 0
+        count = 0
+        for code in step_codes[i]:
+            if code >= 0:
+                total += code
+                count += 1
+        out[i] = total / count if count else 1.0
+    return out
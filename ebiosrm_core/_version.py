@@ -0,0 +1,3 @@
+"""Package version, kept free of imports so it can be read cheaply."""
+
+__version__ = "2.0.0"
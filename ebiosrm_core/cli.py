@@ -3,32 +3,74 @@
 from __future__ import annotations
 
 import logging
+import sys
 from pathlib import Path
 
+# True when this module is the running program rather than an imported library
+_AS_PROGRAM = __name__ == "__main__" or Path(sys.argv[0]).stem == "ebiosrm"
+
+# Fast path: answer version queries before Typer and its dependencies load
+if _AS_PROGRAM and sys.argv[1:2] in (["version"], ["--version"], ["-V"]):
+    from ebiosrm_core._version import __version__
+
+    print(f"EBIOS RM Generator v{__version__}")
+    sys.exit(0)
+
+from typing import Annotated
+
 import typer
-from typing_extensions import Annotated
 
-from . import generator, loader
+_console = None
 
-# Console setup - Rich preferred, fallback to typer
-try:
-    from rich.console import Console
 
-    console = Console()
-except ImportError:
-    # Fallback to typer.echo for console operations
-    class SimpleConsole:
-        def print(self, message, **kwargs):
-            typer.echo(message)
+def _get_console():
+    """Return the output console, importing Rich only on first use."""
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+
+            _console = Console()
+        except ImportError:
+            # Fallback to typer.echo for console operations
+            class SimpleConsole:
+                def print(self, message, **kwargs):
+                    typer.echo(message)
+
+            _console = SimpleConsole()
+    return _console
 
-    console = SimpleConsole()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Default directories shared by the command signatures
+_DEFAULT_CFG = Path("config")
+_DEFAULT_OUT = Path("build")
+
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Configure logging on first use so --help and version stay untouched."""
+    global _logging_configured
+    if not _logging_configured:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter("{asctime} - {name} - {levelname} - {message}", style="{")
+        )
+        logging.basicConfig(level=logging.INFO, handlers=[handler])
+        _logging_configured = True
+
+
+# File extension for each accepted --fmt value
+_FMT_TO_EXT = {
+    "xlsx": "xlsx",
+    "excel": "xlsx",
+    "json": "json",
+    "md": "md",
+    "markdown": "md",
+}
+
 app = typer.Typer(
     name="ebiosrm",
     help="EBIOS Risk Manager - Modular risk assessment generator",
@@ -36,14 +78,24 @@ app = typer.Typer(
 )
 
 
-@app.command()
+@app.callback()
+def main() -> None:
+    """EBIOS Risk Manager - Modular risk assessment generator."""
+
+
+def _sniff_subcommand() -> str | None:
+    """Return the first non-option token of the command line, if any."""
+    for arg in sys.argv[1:]:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def export(
-    cfg: Annotated[Path, typer.Option("--cfg", help="Configuration directory")] = Path(
-        "config"
-    ),
-    out: Annotated[Path, typer.Option("--out", help="Output directory")] = Path(
-        "build"
-    ),
+    cfg: Annotated[
+        Path, typer.Option("--cfg", help="Configuration directory")
+    ] = _DEFAULT_CFG,
+    out: Annotated[Path, typer.Option("--out", help="Output directory")] = _DEFAULT_OUT,
     fmt: Annotated[
         str, typer.Option("--fmt", help="Export format: xlsx|json|excel|markdown")
     ] = "xlsx",
@@ -61,45 +113,27 @@ def export(
 
     Use --pme-profile flag for simplified PME/TPE configuration.
     """
+    _configure_logging()
     try:
+        from . import generator
+
         profile_text = "PME/TPE" if pme_profile else "Standard"
         typer.echo(f"🚀 Starting EBIOS RM risk assessment... (Profile: {profile_text})")
         typer.echo(f"   Config: {cfg}")
         typer.echo(f"   Output: {out}")
         typer.echo(f"   Format: {fmt}")
 
-        # Load PME defaults if requested
-        if pme_profile:
-            pme_config = cfg / "pme_defaults.yaml"
-            if pme_config.exists():
-                import yaml
-
-                with open(pme_config, "r", encoding="utf-8") as f:
-                    yaml.safe_load(f)  # Load but don't store unused settings
-                typer.echo(f"   Using PME profile from: {pme_config}")
+        # The PME profile only changes exporter behaviour; its YAML is not read
+        pme_config = cfg / "pme_defaults.yaml"
+        if pme_profile and pme_config.exists():
+            typer.echo(f"   Using PME profile from: {pme_config}")
 
         # Determine output filename - use default naming if not specified
-        if not output_file:
-            default_name = "ebios_risk_assessment"
-            if fmt.lower() in {"xlsx", "excel"}:
-                output_filename = f"{default_name}.xlsx"
-            elif fmt.lower() == "json":
-                output_filename = f"{default_name}.json"
-            elif fmt.lower() in {"md", "markdown"}:
-                output_filename = f"{default_name}.md"
-            else:
-                output_filename = f"{default_name}.{fmt.lower()}"
-        else:
-            # User provided custom filename
-            if fmt.lower() in {"xlsx", "excel"}:
-                output_filename = f"{output_file}.xlsx"
-            elif fmt.lower() == "json":
-                output_filename = f"{output_file}.json"
-            elif fmt.lower() in {"md", "markdown"}:
-                output_filename = f"{output_file}.md"
-            else:
-                output_filename = f"{output_file}.{fmt.lower()}"
-        console.print(f"output_filename: {output_filename}")
+        fmt_low = fmt.lower()
+        ext = _FMT_TO_EXT.get(fmt_low, fmt_low)
+        stem = output_file or "ebios_risk_assessment"
+        output_filename = f"{stem}.{ext}"
+        _get_console().print(f"output_filename: {output_filename}")
         generator.run(
             cfg_dir=cfg,
             out_dir=out,
@@ -123,44 +157,53 @@ def export(
         raise typer.Exit(1)
 
 
-@app.command()
 def validate(
-    cfg: Annotated[Path, typer.Option("--cfg", help="Configuration directory")] = Path(
-        "config"
-    ),
+    cfg: Annotated[
+        Path, typer.Option("--cfg", help="Configuration directory")
+    ] = _DEFAULT_CFG,
 ) -> None:
     """Validate configuration files without generating reports.
 
     Checks CSV and YAML files for correct format and data consistency.
     """
+    _configure_logging()
     try:
-        typer.echo(f"🔍 Validating configuration in {cfg}...")
-
-        assets, threats, settings, risk_sources, objectives, stakeholders, measures = (
-            loader.load_all(cfg)
-        )
+        import io
 
-        typer.echo("✅ Validation successful!")
-        typer.echo(f"   Assets: {len(assets)} loaded")
-        typer.echo(f"   Threats: {len(threats)} loaded")
-        typer.echo(f"   Risk Sources: {len(risk_sources)} loaded")
-        typer.echo(f"   Objectives: {len(objectives)} loaded")
-        typer.echo(f"   Stakeholders: {len(stakeholders)} loaded")
-        typer.echo(f"   Security Measures: {len(measures)} loaded")
-        typer.echo(f"   Settings: {settings.output_dir}")
+        from . import loader
 
-        # Additional validation checks
-        asset_ids = {asset.id for asset in assets}
-        if len(asset_ids) != len(assets):
-            typer.echo("⚠️  Warning: Duplicate asset IDs detected", err=True)
-
-        threat_ids = {threat.sr_id for threat in threats}
-        if len(threat_ids) != len(threats):
-            typer.echo("⚠️  Warning: Duplicate threat IDs detected", err=True)
+        typer.echo(f"🔍 Validating configuration in {cfg}...")
 
-        objective_ids = {obj.id for obj in objectives}
-        if len(objective_ids) != len(objectives):
-            typer.echo("⚠️  Warning: Duplicate objective IDs detected", err=True)
+        (
+            assets,
+            threats,
+            settings,
+            risk_sources,
+            objectives,
+            stakeholders,
+            measures,
+            dup_report,
+        ) = loader.load_all_cached(cfg, with_report=True)
+
+        # Summary is written in a single call rather than one echo per line
+        buf = io.StringIO()
+        print("✅ Validation successful!", file=buf)
+        print(f"   Assets: {len(assets)} loaded", file=buf)
+        print(f"   Threats: {len(threats)} loaded", file=buf)
+        print(f"   Risk Sources: {len(risk_sources)} loaded", file=buf)
+        print(f"   Objectives: {len(objectives)} loaded", file=buf)
+        print(f"   Stakeholders: {len(stakeholders)} loaded", file=buf)
+        print(f"   Security Measures: {len(measures)} loaded", file=buf)
+        print(f"   Settings: {settings.output_dir}", file=buf)
+        typer.echo(buf.getvalue(), nl=False)
+
+        # Duplicate IDs are collected by the loader while parsing
+        for kind, dupes in dup_report.items():
+            if dupes:
+                typer.echo(
+                    f"⚠️  Warning: Duplicate {kind} IDs detected: {', '.join(dupes)}",
+                    err=True,
+                )
 
     except FileNotFoundError as e:
         typer.echo(f"❌ Error: {e}", err=True)
@@ -174,15 +217,13 @@ def validate(
         raise typer.Exit(1)
 
 
-@app.command()
 def version() -> None:
     """Display version information."""
-    from . import __version__
+    from ._version import __version__
 
     typer.echo(f"EBIOS RM Generator v{__version__}")
 
 
-@app.command()
 def template(
     output: Path = typer.Option(
         Path("templates/"),
@@ -222,5 +263,18 @@ def template(
         raise typer.Exit(1)
 
 
+# Only register the requested command when running as the program; help,
+# unknown commands and library imports (tests) get the full command set.
+_COMMANDS = {
+    "export": export,
+    "validate": validate,
+    "version": version,
+    "template": template,
+}
+_requested = _sniff_subcommand() if _AS_PROGRAM else None
+for _name, _command in _COMMANDS.items():
+    if _requested not in _COMMANDS or _name == _requested:
+        app.command()(_command)
+
 if __name__ == "__main__":
     app()
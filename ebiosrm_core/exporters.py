@@ -1,26 +1,90 @@
 """Export functions for different output formats with EBIOS RM compliance."""
 
+import datetime
 import json
 import logging
+import warnings
+from collections import Counter
+from zipfile import ZIP_DEFLATED, ZipFile
 from pathlib import Path
 from typing import Dict, Any
 
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.workbook import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 from openpyxl.worksheet.datavalidation import DataValidation
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+from openpyxl.writer.excel import ExcelWriter
+from pydantic import TypeAdapter
 from openpyxl.formatting.rule import CellIsRule
 from openpyxl.utils import get_column_letter
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Serializes plain data and pydantic models alike, straight to JSON bytes
+_JSON_TA = TypeAdapter(Any)
 
-def export_json(data: Dict[str, Any], output_path: Path) -> None:
-    """Export data to JSON format."""
-    logger.info(f"Exporting to JSON: {output_path}")
+# Column letters indexed by 1-based column number (Excel allows 16384 columns)
+_COLS = ("",) + tuple(get_column_letter(i) for i in range(1, 16385))
+
+
+def _solid_fill(color: str) -> PatternFill:
+    return PatternFill(start_color=color, end_color=color, fill_type="solid")
+
+
+# Shared header styles, built once and reused by every Atelier sheet
+_HEADER_FONT = Font(bold=True, color="FFFFFF")
+_HEADER_ALIGN = Alignment(horizontal="center")
+_FILLS = {
+    "socle": _solid_fill("366092"),
+    "sources": _solid_fill("D35400"),
+    "scenarios": _solid_fill("8E44AD"),
+    "operationnels": _solid_fill("E67E22"),
+    "traitement": _solid_fill("27AE60"),
+}
+
+# Risk level highlighting used by the conditional formatting rules
+_RISK_FILLS = {
+    "Critical": _solid_fill("C0392B"),
+    "High": _solid_fill("E74C3C"),
+    "Medium": _solid_fill("F39C12"),
+    "Low": _solid_fill("27AE60"),
+}
+_RISK_FONT = Font(color="FFFFFF", bold=True)
 
+# Numeric scales of the impact and likelihood levels in Atelier 3, matching the
+# lookup tables of the reference sheet
+_IMPACT_SCORES = {"Critical": 4, "High": 3, "Medium": 2, "Low": 1}
+_LIKELIHOOD_SCORES = {"Systematic": 4, "Probable": 3, "Occasional": 2, "One-shot": 1}
+
+
+def _priority(score: int) -> str:
+    """Map an impact x likelihood score to its Atelier 3 priority label."""
+    if score >= 12:
+        return "Critique"
+    if score >= 6:
+        return "Élevé"
+    if score >= 3:
+        return "Moyen"
+    return "Faible"
+
+
+# Inline dropdown list for the measure status column
+_MEASURE_STATUSES = ("Planifiée", "En cours", "Terminée", "Annulée")
+_STATUS_LIST_FORMULA = f'"{",".join(_MEASURE_STATUSES)}"'
+
+
+def _json_document(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Arrange export data into the JSON report layout."""
     # Create structured output with metadata as expected by tests
-    structured_data = {
+    return {
         "metadata": {
             "total_risks": len(data.get("risk_results", [])),
             "total_assets": len(data.get("assets", [])),
@@ -39,65 +103,98 @@ def export_json(data: Dict[str, Any], output_path: Path) -> None:
         },
     }
 
+
+def export_json(data: Dict[str, Any], output_path: Path) -> None:
+    """Export data to JSON format."""
+    logger.info(f"Exporting to JSON: {output_path}")
+
+    structured_data = _json_document(data)
+
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly, so accents are kept as-is
+        with open(output_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    structured_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        return
+
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(structured_data, f, indent=2, ensure_ascii=False)
 
 
-def export_markdown(data: Dict[str, Any], output_path: Path) -> None:
-    """Export data to Markdown format."""
-    logger.info(f"Exporting to Markdown: {output_path}")
+def export_json_models(data: Dict[str, Any], output_path: Path) -> None:
+    """Export data holding pydantic models to JSON format.
 
-    # Create basic markdown structure
-    content = []
-    content.append("# EBIOS RM Risk Assessment Report")
-    content.append("")
-    content.append("## Risk Distribution")
-    content.append("")
+    ``data`` has the same keys as for :func:`export_json`, but the model lists
+    and settings are passed as loaded. pydantic-core serializes them straight
+    to bytes, so no intermediate dicts are built.
+    """
+    logger.info(f"Exporting to JSON: {output_path}")
 
-    # Add risk summary
-    risk_results = data.get("risk_results", [])
-    if risk_results:
-        content.append("| Risk Level | Count |")
-        content.append("|------------|-------|")
+    with open(output_path, "wb") as f:
+        f.write(_JSON_TA.dump_json(_json_document(data), indent=2))
 
-        risk_counts = {}
-        for risk in risk_results:
-            level = risk.get("risk_level", "Unknown")
-            risk_counts[level] = risk_counts.get(level, 0) + 1
 
-        for level, count in risk_counts.items():
-            content.append(f"| {level} | {count} |")
+def export_markdown(data: Dict[str, Any], output_path: Path) -> None:
+    """Export data to Markdown format."""
+    logger.info(f"Exporting to Markdown: {output_path}")
 
-    content.append("")
-    content.append("## Assets")
-    content.append("")
+    # Stream the report line by line through a large write buffer
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        # Create basic markdown structure
+        f.write(b"# EBIOS RM Risk Assessment Report\n\n## Risk Distribution\n\n")
+
+        # Add risk summary
+        risk_counts = _tally_risks(data.get("risk_results", []))
+        if risk_counts:
+            f.write(b"| Risk Level | Count |\n|------------|-------|\n")
+            f.writelines(
+                f"| {level} | {count} |\n".encode()
+                for level, count in risk_counts.items()
+            )
 
-    # Add assets table
-    assets = data.get("assets", [])
-    if assets:
-        content.append("| ID | Type | Label | Criticality |")
-        content.append("|----|------|-------|-------------|")
-        for asset in assets:
-            content.append(
-                f"| {asset['id']} | {asset['type']} | {asset['label']} | {asset['criticality']} |"
+        f.write(b"\n## Assets\n\n")
+
+        # Add assets table
+        assets = data.get("assets", [])
+        if assets:
+            f.write(b"| ID | Type | Label | Criticality |\n")
+            f.write(b"|----|------|-------|-------------|\n")
+            f.writelines(
+                f"| {asset['id']} | {asset['type']} | {asset['label']} "
+                f"| {asset['criticality']} |\n".encode()
+                for asset in assets
             )
 
-    # Write to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(content))
+
+def _tally_risks(risk_results) -> Dict[str, int]:
+    """Count risk results per risk level, in order of first appearance.
+
+    Accepts an iterable of result dicts, such as the generator from
+    ``generator.iter_risk_levels``, or the column dict returned by
+    ``generator.calculate_risk_columns``.
+    """
+    if isinstance(risk_results, dict):
+        return Counter(risk_results["risk_level"])
+    return Counter(risk.get("risk_level", "Unknown") for risk in risk_results)
 
 
 def export_excel(
     data: Dict[str, Any], output_path: Path, pme_profile: bool = False
 ) -> None:
-    """Export data to Excel format with EBIOS RM compliance."""
-    logger.info(f"Exporting to Excel: {output_path} (PME profile: {pme_profile})")
+    """Export data to Excel format with EBIOS RM compliance.
 
-    wb = Workbook()
+    The workbook is built in openpyxl write-only mode: every sheet streams its
+    rows with ``ws.append``, so column widths, freeze panes and header styles
+    are set before the first row is written.
+    """
+    logger.info(f"Exporting to Excel: {output_path} (PME profile: {pme_profile})")
 
-    # Remove default sheet
-    if "Sheet" in wb.sheetnames:
-        wb.remove(wb["Sheet"])
+    wb = Workbook(write_only=True)
+    _add_header_styles(wb)
 
     # Create hidden reference sheet first
     _create_references_sheet(wb, data, pme_profile)
@@ -120,7 +217,63 @@ def export_excel(
     # Set first visible sheet as active
     wb.active = wb["Atelier1_Socle"]
 
-    wb.save(output_path)
+    _save_workbook(wb, output_path)
+
+
+def _save_workbook(wb: Workbook, output_path: Path) -> None:
+    """Save the workbook with fast deflate.
+
+    Mirrors ``Workbook.save`` but uses compression level 1: deflate dominates
+    save time at openpyxl's default level for a few percent of file size.
+    """
+    archive = ZipFile(output_path, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=1)
+    wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(
+        tzinfo=None
+    )
+    ExcelWriter(wb, archive).save()
+
+
+def _add_header_styles(wb: Workbook) -> None:
+    """Register one named header style per Atelier fill on the workbook."""
+    for key, fill in _FILLS.items():
+        wb.add_named_style(
+            NamedStyle(
+                name=f"ebios_header_{key}",
+                font=_HEADER_FONT,
+                fill=fill,
+                alignment=_HEADER_ALIGN,
+            )
+        )
+
+
+def _header_row(ws, headers: list[str], fill_key: str) -> list[WriteOnlyCell]:
+    """Build a header row using the named style registered for ``fill_key``."""
+    style = f"ebios_header_{fill_key}"
+    row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = style
+        row.append(cell)
+    return row
+
+
+def _add_table(ws, name: str, headers: list[str], end_row: int, style: str) -> None:
+    """Add a formatted table over the header row and ``end_row`` data rows.
+
+    Write-only sheets cannot read their header cells back, so the table
+    columns are named from ``headers`` up front.
+    """
+    ref = f"A1:{_COLS[len(headers)]}{end_row}"
+    table = Table(displayName=name, ref=ref)
+    table.tableColumns = [
+        TableColumn(id=i, name=header) for i, header in enumerate(headers, 1)
+    ]
+    table.autoFilter = AutoFilter(ref=ref)
+    table.tableStyleInfo = TableStyleInfo(name=style, showFirstColumn=False)
+    with warnings.catch_warnings():
+        # openpyxl always warns in write-only mode; the columns are set above
+        warnings.filterwarnings("ignore", "In write-only mode", UserWarning)
+        ws.add_table(table)
 
 
 def _create_references_sheet(
@@ -154,35 +307,19 @@ def _create_references_sheet(
             "Commercial",
         ]
 
-    # Store lists in columns
+    # Store lists in columns A to I, keyed by column number
     reference_lists = {
-        "A": ("Impact_Levels", impact_levels),
-        "B": ("Likelihood_Levels", likelihood_levels),
-        "C": ("Asset_Types", asset_types),
-        "D": ("Threat_Categories", threat_categories),
-        "E": ("Risk_Sources", [rs["id"] for rs in data.get("risk_sources", [])]),
-        "F": ("Assets", [asset["id"] for asset in data.get("assets", [])]),
-        "G": ("Stakeholders", [st["id"] for st in data.get("stakeholders", [])]),
-        "H": ("Measure_Types", ["Preventive", "Detective", "Corrective", "Recovery"]),
-        "I": ("Treatment_Options", ["Réduire", "Éviter", "Transférer", "Accepter"]),
+        1: ("Impact_Levels", impact_levels),
+        2: ("Likelihood_Levels", likelihood_levels),
+        3: ("Asset_Types", asset_types),
+        4: ("Threat_Categories", threat_categories),
+        5: ("Risk_Sources", [rs["id"] for rs in data.get("risk_sources", [])]),
+        6: ("Assets", [asset["id"] for asset in data.get("assets", [])]),
+        7: ("Stakeholders", [st["id"] for st in data.get("stakeholders", [])]),
+        8: ("Measure_Types", ["Preventive", "Detective", "Corrective", "Recovery"]),
+        9: ("Treatment_Options", ["Réduire", "Éviter", "Transférer", "Accepter"]),
     }
 
-    for col, (list_name, items) in reference_lists.items():
-        # Header
-        ws[f"{col}1"] = list_name
-        ws[f"{col}1"].font = Font(bold=True)
-
-        # Items
-        for i, item in enumerate(items, 2):
-            ws[f"{col}{i}"] = item
-
-        # Define named range using correct openpyxl API
-        end_row = len(items) + 1
-        from openpyxl.workbook.defined_name import DefinedName
-
-        defn = DefinedName(list_name, attr_text=f"__REFS!${col}$2:${col}${end_row}")
-        wb.defined_names[list_name] = defn
-
     # Add lookup tables for formula references
     impact_lookup = [
         ["Impact", "Value"],
@@ -200,19 +337,43 @@ def _create_references_sheet(
         ["One-shot", 1],
     ]
 
-    # Add lookup tables starting from column K
-    for i, row_data in enumerate(impact_lookup):
-        ws.cell(row=i + 1, column=11, value=row_data[0])  # Column K
-        ws.cell(row=i + 1, column=12, value=row_data[1])  # Column L
+    # Lay the sheet out as a grid first: write-only sheets are filled row by row
+    n_rows = max(
+        max(len(items) + 1 for _, items in reference_lists.values()),
+        len(impact_lookup),
+    )
+    rows = [[None] * 14 for _ in range(n_rows)]
+
+    for col_idx, (list_name, items) in reference_lists.items():
+        # Header
+        header = WriteOnlyCell(ws, value=list_name)
+        header.font = Font(bold=True)
+        rows[0][col_idx - 1] = header
+
+        # Items
+        for i, item in enumerate(items, 1):
+            rows[i][col_idx - 1] = item
+
+        # Define named range using correct openpyxl API
+        end_row = len(items) + 1
+        col = _COLS[col_idx]
+        defn = DefinedName(list_name, attr_text=f"__REFS!${col}$2:${col}${end_row}")
+        wb.defined_names[list_name] = defn
+
+    # Lookup tables starting from column K
+    for i, (impact_row, likelihood_row) in enumerate(
+        zip(impact_lookup, likelihood_lookup)
+    ):
+        rows[i][10:14] = [*impact_row, *likelihood_row]  # Columns K to N
 
-    for i, row_data in enumerate(likelihood_lookup):
-        ws.cell(row=i + 1, column=13, value=row_data[0])  # Column M
-        ws.cell(row=i + 1, column=14, value=row_data[1])  # Column N
+    for row in rows:
+        ws.append(row)
 
 
 def _create_atelier1_socle(wb: Workbook, data: Dict[str, Any]) -> None:
     """Create Atelier 1 - Socle worksheet."""
     ws = wb.create_sheet("Atelier1_Socle")  # Remove spaces and special chars
+    assets = data.get("assets", [])
 
     # Headers
     headers = [
@@ -228,62 +389,62 @@ def _create_atelier1_socle(wb: Workbook, data: Dict[str, Any]) -> None:
         "Location",
     ]
 
-    # Set headers with styling
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="366092", end_color="366092", fill_type="solid"
-        )
-        cell.alignment = Alignment(horizontal="center")
-
-    # Add data
-    for row, asset in enumerate(data.get("assets", []), 2):
-        ws.cell(row=row, column=1, value=asset["id"])
-        ws.cell(row=row, column=2, value=asset["type"])
-        ws.cell(row=row, column=3, value=asset["label"])
-        ws.cell(row=row, column=4, value="Description à compléter")
-        ws.cell(row=row, column=5, value=asset["criticality"])
-        # Add empty cells for CIA and owner
-        for col in range(6, 11):
-            ws.cell(row=row, column=col, value="")
+    # Build data rows, with empty cells for CIA and owner, tracking the
+    # widest value per column as we go
+    widths = [len(header) for header in headers]
+    rows = []
+    for asset in assets:
+        row = [
+            asset["id"],
+            asset["type"],
+            asset["label"],
+            "Description à compléter",
+            asset["criticality"],
+            "",
+            "",
+            "",
+            "",
+            "",
+        ]
+        for col, value in enumerate(row):
+            if value:
+                widths[col] = max(widths[col], len(str(value)))
+        rows.append(row)
+
+    # Auto-size columns (must be set before any row is streamed)
+    for col, width in enumerate(widths, 1):
+        ws.column_dimensions[_COLS[col]].width = min(width + 2, 30)
+
+    # Freeze panes
+    ws.freeze_panes = "B2"
+
+    # Set headers with styling, then data
+    ws.append(_header_row(ws, headers, "socle"))
+    for row in rows:
+        ws.append(row)
+
+    # Validations cover the same rows as the table below
+    end_row = max(len(assets) + 1, 10)
 
     # Add data validation for criticality
     dv_criticality = DataValidation(type="list", formula1="Impact_Levels")
-    ws.add_data_validation(dv_criticality)
-    dv_criticality.add(f"E2:E{len(data.get('assets', [])) + 10}")
+    ws.data_validations.append(dv_criticality)
+    dv_criticality.add(f"E2:E{end_row}")
 
     # Add data validation for asset types
     dv_types = DataValidation(type="list", formula1="Asset_Types")
-    ws.add_data_validation(dv_types)
-    dv_types.add(f"B2:B{len(data.get('assets', [])) + 10}")
+    ws.data_validations.append(dv_types)
+    dv_types.add(f"B2:B{end_row}")
 
     # Create table
-    end_row = max(len(data.get("assets", [])) + 1, 10)
-    table = Table(
-        displayName="tbl_Socle", ref=f"A1:{get_column_letter(len(headers))}{end_row}"
-    )
-    table.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium2", showFirstColumn=False
-    )
-    ws.add_table(table)
-
-    # Freeze panes
-    ws.freeze_panes = "B2"
-
-    # Auto-size columns
-    for column in ws.columns:
-        max_length = 0
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            if cell.value:
-                max_length = max(max_length, len(str(cell.value)))
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 30)
+    _add_table(ws, "tbl_Socle", headers, end_row, "TableStyleMedium2")
 
 
 def _create_atelier2_sources(wb: Workbook, data: Dict[str, Any]) -> None:
     """Create Atelier 2 - Sources de risque worksheet."""
     ws = wb.create_sheet("Atelier2_Sources")  # Remove spaces and special chars
+    sources = data.get("risk_sources", [])
+    ws.freeze_panes = "B2"
 
     headers = [
         "Source ID",
@@ -298,51 +459,45 @@ def _create_atelier2_sources(wb: Workbook, data: Dict[str, Any]) -> None:
     ]
 
     # Set headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="D35400", end_color="D35400", fill_type="solid"
+    ws.append(_header_row(ws, headers, "sources"))
+
+    # Add data, with empty cells for analysis
+    for source in sources:
+        ws.append(
+            [
+                source["id"],
+                source["label"],
+                source["category"],
+                source["motivation"],
+                source["capability_level"],
+                source["resources"],
+                "",
+                "",
+                "",
+            ]
         )
-        cell.alignment = Alignment(horizontal="center")
-
-    # Add data
-    for row, source in enumerate(data.get("risk_sources", []), 2):
-        ws.cell(row=row, column=1, value=source["id"])
-        ws.cell(row=row, column=2, value=source["label"])
-        ws.cell(row=row, column=3, value=source["category"])
-        ws.cell(row=row, column=4, value=source["motivation"])
-        ws.cell(row=row, column=5, value=source["capability_level"])
-        ws.cell(row=row, column=6, value=source["resources"])
-        # Add empty cells for analysis
-        for col in range(7, 10):
-            ws.cell(row=row, column=col, value="")
+
+    # Validations cover the same rows as the table below
+    end_row = max(len(sources) + 1, 20)
 
     # Add validations
     dv_capability = DataValidation(type="list", formula1="Impact_Levels")
-    ws.add_data_validation(dv_capability)
-    dv_capability.add("E2:E100")
+    ws.data_validations.append(dv_capability)
+    dv_capability.add(f"E2:E{end_row}")
 
     dv_category = DataValidation(type="list", formula1="Threat_Categories")
-    ws.add_data_validation(dv_category)
-    dv_category.add("C2:C100")
+    ws.data_validations.append(dv_category)
+    dv_category.add(f"C2:C{end_row}")
 
     # Create table
-    end_row = max(len(data.get("risk_sources", [])) + 1, 20)
-    table = Table(
-        displayName="tbl_Sources", ref=f"A1:{get_column_letter(len(headers))}{end_row}"
-    )
-    table.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium4", showFirstColumn=False
-    )
-    ws.add_table(table)
-
-    ws.freeze_panes = "B2"
+    _add_table(ws, "tbl_Sources", headers, end_row, "TableStyleMedium4")
 
 
 def _create_atelier3_scenarios_strategiques(wb: Workbook, data: Dict[str, Any]) -> None:
     """Create Atelier 3 - Scénarios stratégiques worksheet."""
     ws = wb.create_sheet("Atelier3_Scenarios")  # Remove spaces and special chars
+    threats = data.get("threats", [])
+    ws.freeze_panes = "B2"
 
     headers = [
         "Scenario ID",
@@ -357,83 +512,51 @@ def _create_atelier3_scenarios_strategiques(wb: Workbook, data: Dict[str, Any])
     ]
 
     # Set headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="8E44AD", end_color="8E44AD", fill_type="solid"
-        )
-        cell.alignment = Alignment(horizontal="center")
+    ws.append(_header_row(ws, headers, "scenarios"))
 
-    # Add threats data
-    for row, threat in enumerate(data.get("threats", []), 2):
-        ws.cell(row=row, column=1, value=threat["sr_id"])
-        ws.cell(
-            row=row,
-            column=2,
-            value=threat.get("risk_sources", [""])[0]
-            if threat.get("risk_sources")
-            else "",
-        )
-        ws.cell(
-            row=row,
-            column=3,
-            value=threat.get("targeted_objectives", [""])[0]
-            if threat.get("targeted_objectives")
-            else "",
-        )
-        ws.cell(row=row, column=4, value=threat["strategic_path"])
-        ws.cell(row=row, column=5, value="À définir")
-        ws.cell(row=row, column=6, value="High")
-        ws.cell(row=row, column=7, value="Medium")
-        # Risk score formula using VLOOKUP references
-        ws.cell(
-            row=row,
-            column=8,
-            value=f'=VLOOKUP(F{row},$__REFS.$A$2:$B$5,2,0)*VLOOKUP(G{row},$__REFS.$C$2:$D$5,2,0)',
-        )
+    # Default levels, scored once in Python rather than by formulas in Excel
+    impact, likelihood = "High", "Occasional"
+    score = _IMPACT_SCORES[impact] * _LIKELIHOOD_SCORES[likelihood]
+    priority = _priority(score)
 
-        # Simplified priority formula
-        ws.cell(
-            row=row,
-            column=9,
-            value=f'=IF(H{row}>=12,"Critique",IF(H{row}>=6,"Élevé",IF(H{row}>=3,"Moyen","Faible")))',
+    # Add threats data
+    for threat in threats:
+        rs = threat.get("risk_sources")
+        to_ = threat.get("targeted_objectives")
+        ws.append(
+            [
+                threat["sr_id"],
+                rs[0] if rs else "",
+                to_[0] if to_ else "",
+                threat["strategic_path"],
+                "À définir",
+                impact,
+                likelihood,
+                score,
+                priority,
+            ]
         )
 
-    # Add validations
-    dv_impact = DataValidation(type="list", formula1="Impact_Levels")
-    ws.add_data_validation(dv_impact)
-    dv_impact.add("F2:F100")
-
-    dv_likelihood = DataValidation(type="list", formula1="Likelihood_Levels")
-    ws.add_data_validation(dv_likelihood)
-    dv_likelihood.add("G2:G100")
+    # Validations and formatting cover the same rows as the table below
+    end_row = max(len(threats) + 1, 20)
 
+    # Add validations; impact and likelihood have no dropdowns because the
+    # score and priority written from them would not follow an edit
     dv_sources = DataValidation(type="list", formula1="Risk_Sources")
-    ws.add_data_validation(dv_sources)
-    dv_sources.add("B2:B100")
+    ws.data_validations.append(dv_sources)
+    dv_sources.add(f"B2:B{end_row}")
 
     # Conditional formatting for priority
     priority_rule = CellIsRule(
         operator="equal",
         formula=['"Critique"'],
-        fill=PatternFill(start_color="C0392B", end_color="C0392B", fill_type="solid"),
-        font=Font(color="FFFFFF", bold=True),
+        fill=_RISK_FILLS["Critical"],
+        font=_RISK_FONT,
     )
-    ws.conditional_formatting.add("I2:I100", priority_rule)
+    ws.conditional_formatting.add(f"I2:I{end_row}", priority_rule)
 
     # Create table
-    end_row = max(len(data.get("threats", [])) + 1, 20)
-    table = Table(
-        displayName="tbl_StratScen",
-        ref=f"A1:{get_column_letter(len(headers))}{end_row}",
-    )
-    table.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium6", showFirstColumn=False
-    )
-    ws.add_table(table)
-
-    ws.freeze_panes = "B2"
+    _add_table(ws, "tbl_StratScen", headers, end_row, "TableStyleMedium6")
 
 
 def _create_atelier4_scenarios_operationnels(
@@ -441,6 +564,8 @@ def _create_atelier4_scenarios_operationnels(
 ) -> None:
     """Create Atelier 4 - Scénarios opérationnels worksheet."""
     ws = wb.create_sheet("Atelier4_Operationnels")  # Remove spaces and special chars
+    threats = data.get("threats", [])
+    ws.freeze_panes = "B2"
 
     headers = [
         "OV ID",
@@ -455,31 +580,28 @@ def _create_atelier4_scenarios_operationnels(
     ]
 
     # Set headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="E67E22", end_color="E67E22", fill_type="solid"
-        )
-        cell.alignment = Alignment(horizontal="center")
+    ws.append(_header_row(ws, headers, "operationnels"))
 
     # Add threats with operational view
-    for row, threat in enumerate(data.get("threats", []), 2):
-        ws.cell(row=row, column=1, value=threat["ov_id"])
-        ws.cell(row=row, column=2, value=threat["sr_id"])
-        ws.cell(row=row, column=3, value="À définir")
-        ws.cell(row=row, column=4, value=threat["operational_steps"])
-        ws.cell(row=row, column=5, value="À évaluer")
-        ws.cell(row=row, column=6, value="Medium")
-        ws.cell(row=row, column=7, value="High")
-        ws.cell(row=row, column=8, value="High")
-        # Simplified risk level calculation
-        ws.cell(
-            row=row,
-            column=9,
-            value=f'=IF(AND(F{row}="High",H{row}="High"),"Critical",IF(OR(F{row}="High",H{row}="High"),"High","Medium"))',
+    for row, threat in enumerate(threats, 2):
+        ws.append(
+            [
+                threat["ov_id"],
+                threat["sr_id"],
+                "À définir",
+                threat["operational_steps"],
+                "À évaluer",
+                "Medium",
+                "High",
+                "High",
+                # Simplified risk level calculation
+                f'=IF(AND(F{row}="High",H{row}="High"),"Critical",IF(OR(F{row}="High",H{row}="High"),"High","Medium"))',
+            ]
         )
 
+    # Validations and formatting cover the same rows as the table below
+    end_row = max(len(threats) + 1, 20)
+
     # Add validations
     for col_letter, range_name in [
         ("F", "Likelihood_Levels"),
@@ -487,42 +609,28 @@ def _create_atelier4_scenarios_operationnels(
         ("H", "Impact_Levels"),
     ]:
         dv = DataValidation(type="list", formula1=range_name)
-        ws.add_data_validation(dv)
-        dv.add(f"{col_letter}2:{col_letter}100")
+        ws.data_validations.append(dv)
+        dv.add(f"{col_letter}2:{col_letter}{end_row}")
 
     # Conditional formatting for risk levels
-    risk_colors = {
-        "Critical": "C0392B",
-        "High": "E74C3C",
-        "Medium": "F39C12",
-        "Low": "27AE60",
-    }
-
-    for risk_level, color in risk_colors.items():
+    for risk_level, fill in _RISK_FILLS.items():
         rule = CellIsRule(
             operator="equal",
             formula=[f'"{risk_level}"'],
-            fill=PatternFill(start_color=color, end_color=color, fill_type="solid"),
-            font=Font(color="FFFFFF", bold=True),
+            fill=fill,
+            font=_RISK_FONT,
         )
-        ws.conditional_formatting.add("I2:I100", rule)
+        ws.conditional_formatting.add(f"I2:I{end_row}", rule)
 
     # Create table
-    end_row = max(len(data.get("threats", [])) + 1, 20)
-    table = Table(
-        displayName="tbl_OpScen", ref=f"A1:{get_column_letter(len(headers))}{end_row}"
-    )
-    table.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium8", showFirstColumn=False
-    )
-    ws.add_table(table)
-
-    ws.freeze_panes = "B2"
+    _add_table(ws, "tbl_OpScen", headers, end_row, "TableStyleMedium8")
 
 
 def _create_atelier5_traitement(wb: Workbook, data: Dict[str, Any]) -> None:
     """Create Atelier 5 - Traitement du risque worksheet."""
     ws = wb.create_sheet("Atelier5_Traitement")  # Remove spaces and special chars
+    measures = data.get("measures", [])
+    ws.freeze_panes = "B2"
 
     headers = [
         "Risk ID",
@@ -538,26 +646,27 @@ def _create_atelier5_traitement(wb: Workbook, data: Dict[str, Any]) -> None:
     ]
 
     # Set headers
-    for col, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col, value=header)
-        cell.font = Font(bold=True, color="FFFFFF")
-        cell.fill = PatternFill(
-            start_color="27AE60", end_color="27AE60", fill_type="solid"
-        )
-        cell.alignment = Alignment(horizontal="center")
+    ws.append(_header_row(ws, headers, "traitement"))
 
     # Add measures data
-    for row, measure in enumerate(data.get("measures", []), 2):
-        ws.cell(row=row, column=1, value=f"R{row - 1:03d}")
-        ws.cell(row=row, column=2, value="High")  # Default
-        ws.cell(row=row, column=3, value="Réduire")
-        ws.cell(row=row, column=4, value=measure["label"])
-        ws.cell(row=row, column=5, value=measure["responsible_stakeholder"])
-        ws.cell(row=row, column=6, value="À définir")
-        ws.cell(row=row, column=7, value=measure["implementation_cost"])
-        ws.cell(row=row, column=8, value=measure["effectiveness"])
-        ws.cell(row=row, column=9, value="Medium")  # Default residual
-        ws.cell(row=row, column=10, value="Planifiée")
+    for row, measure in enumerate(measures, 2):
+        ws.append(
+            [
+                f"R{row - 1:03d}",
+                "High",  # Default
+                "Réduire",
+                measure["label"],
+                measure["responsible_stakeholder"],
+                "À définir",
+                measure["implementation_cost"],
+                measure["effectiveness"],
+                "Medium",  # Default residual
+                "Planifiée",
+            ]
+        )
+
+    # Validations cover the same rows as the table below
+    end_row = max(len(measures) + 1, 20)
 
     # Add validations
     validations = {
@@ -567,73 +676,87 @@ def _create_atelier5_traitement(wb: Workbook, data: Dict[str, Any]) -> None:
         "G": "Impact_Levels",  # Cost
         "H": "Impact_Levels",  # Effectiveness
         "I": "Impact_Levels",  # Residual Risk
-        "J": ["Planifiée", "En cours", "Terminée", "Annulée"],  # Status
+        "J": _STATUS_LIST_FORMULA,  # Status
     }
 
     for col, validation_source in validations.items():
-        if isinstance(validation_source, str):
-            dv = DataValidation(type="list", formula1=validation_source)
-        else:
-            # Create inline list for status
-            dv = DataValidation(
-                type="list", formula1=f'"{",".join(validation_source)}"'
-            )
-        ws.add_data_validation(dv)
-        dv.add(f"{col}2:{col}100")
+        dv = DataValidation(type="list", formula1=validation_source)
+        ws.data_validations.append(dv)
+        dv.add(f"{col}2:{col}{end_row}")
 
     # Create table
-    end_row = max(len(data.get("measures", [])) + 1, 20)
-    table = Table(
-        displayName="tbl_Treatment",
-        ref=f"A1:{get_column_letter(len(headers))}{end_row}",
-    )
-    table.tableStyleInfo = TableStyleInfo(
-        name="TableStyleMedium10", showFirstColumn=False
-    )
-    ws.add_table(table)
-
-    ws.freeze_panes = "B2"
+    _add_table(ws, "tbl_Treatment", headers, end_row, "TableStyleMedium10")
 
 
 def _create_synthese_sheet(wb: Workbook, data: Dict[str, Any]) -> None:
     """Create synthesis dashboard worksheet."""
     ws = wb.create_sheet("Synthese")  # Remove accents
+    ws.freeze_panes = "A2"
 
-    # Title
-    ws["A1"] = "SYNTHÈSE EBIOS RISK MANAGER"
-    ws["A1"].font = Font(size=16, bold=True, color="2C3E50")
-    ws.merge_cells("A1:F1")
+    def styled(value, font: Font) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.font = font
+        return cell
 
-    # Risk distribution summary
-    ws["A3"] = "Répartition des risques"
-    ws["A3"].font = Font(size=12, bold=True)
+    section_font = Font(size=12, bold=True)
 
+    # Title
+    ws.append(
+        [
+            styled(
+                "SYNTHÈSE EBIOS RISK MANAGER", Font(size=16, bold=True, color="2C3E50")
+            )
+        ]
+    )
+    ws.merged_cells.add("A1:F1")
+    ws.append([])
+
+    # Risk distribution summary, next to the assets coverage section
+    ws.append(
+        [
+            styled("Répartition des risques", section_font),
+            None,
+            None,
+            styled("Couverture des actifs", section_font),
+        ]
+    )
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(
+        start_color="BDC3C7", end_color="BDC3C7", fill_type="solid"
+    )
     risk_summary_headers = ["Niveau de risque", "Nombre", "Pourcentage"]
-    for col, header in enumerate(risk_summary_headers, 1):
-        cell = ws.cell(row=4, column=col, value=header)
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(
-            start_color="BDC3C7", end_color="BDC3C7", fill_type="solid"
-        )
+    header_cells = []
+    for header in risk_summary_headers:
+        cell = styled(header, header_font)
+        cell.fill = header_fill
+        header_cells.append(cell)
+    ws.append(header_cells)
 
     # Add risk level summary formulas
     risk_levels = ["Critical", "High", "Medium", "Low"]
     for i, level in enumerate(risk_levels, 5):
-        ws.cell(row=i, column=1, value=level)
-        # Use correct sheet reference without spaces
-        ws.cell(row=i, column=2, value=f'=COUNTIF(Atelier3_Scenarios.I:I,"{level}")')
-        ws.cell(row=i, column=3, value=f'=IF(SUM(B5:B8)>0,B{i}/SUM(B5:B8)*100,0)&"%"')
+        ws.append(
+            [
+                level,
+                # Use correct sheet reference without spaces
+                f'=COUNTIF(Atelier3_Scenarios.I:I,"{level}")',
+                f'=IF(SUM(B5:B8)>0,B{i}/SUM(B5:B8)*100,0)&"%"',
+            ]
+        )
+    ws.append([])
 
     # Top risks section
-    ws["A10"] = "Top 5 des risques prioritaires"
-    ws["A10"].font = Font(size=12, bold=True)
-
-    # Assets coverage
-    ws["D3"] = "Couverture des actifs"
-    ws["D3"].font = Font(size=12, bold=True)
+    ws.append([styled("Top 5 des risques prioritaires", section_font)])
+    for _ in range(11, 15):
+        ws.append([])
 
     # Add charts placeholder
-    ws["A15"] = "Graphiques et indicateurs à ajouter ici"
-    ws["A15"].font = Font(italic=True, color="7F8C8D")
-
-    ws.freeze_panes = "A2"
+    ws.append(
+        [
+            styled(
+                "Graphiques et indicateurs à ajouter ici",
+                Font(italic=True, color="7F8C8D"),
+            )
+        ]
+    )
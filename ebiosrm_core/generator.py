@@ -2,43 +2,131 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+
+import numpy as np
+from pydantic import TypeAdapter
 
 from . import loader, exporters
-from .models import Asset, Threat
+from .models import (
+    Asset,
+    RiskSource,
+    SecurityMeasure,
+    Stakeholder,
+    TargetedObjective,
+    Threat,
+)
 
 logger = logging.getLogger(__name__)
 
-
-def calculate_risk_levels(
+# Serialize each collection in one pass instead of one model_dump() per item
+_ASSETS_TA = TypeAdapter(list[Asset])
+_THREATS_TA = TypeAdapter(list[Threat])
+_RISK_SOURCES_TA = TypeAdapter(list[RiskSource])
+_OBJECTIVES_TA = TypeAdapter(list[TargetedObjective])
+_STAKEHOLDERS_TA = TypeAdapter(list[Stakeholder])
+_MEASURES_TA = TypeAdapter(list[SecurityMeasure])
+
+
+# Keys of each risk result, in output order; "max_severity" duplicates
+# "severity_score" for test compatibility and "affected_assets" is simplified
+# to every asset
+_RESULT_KEYS = (
+    "threat_id",
+    "threat_ov",
+    "strategic_path",
+    "operational_steps",
+    "likelihood_score",
+    "max_severity",
+    "severity_score",
+    "risk_level",
+    "affected_assets",
+)
+
+
+def _score_threats(assets: list[Asset], threats: list[Threat]):
+    """Score all threats at once against the worst asset severity.
+
+    Returns the severity, the shared affected asset IDs and the likelihood
+    and risk level arrays, one entry per threat.
+    """
+    # Every threat is rated against all assets, so the worst severity and the
+    # affected IDs are the same for each of them; the IDs are shared as one
+    # read-only tuple
+    # In a real implementation, you'd filter based on threat-asset relationships
+    max_severity = int(Asset.severity_vector(assets).max())
+    affected_ids = tuple(asset.id for asset in assets)
+
+    likelihoods = Threat.likelihood_vector(threats)
+    risk_levels = Threat.risk_vector(threats, max_severity, likelihoods)
+    return max_severity, affected_ids, likelihoods, risk_levels
+
+
+def calculate_risk_columns(
     assets: list[Asset], threats: list[Threat]
-) -> list[Dict[str, Any]]:
-    """Calculate risk levels for all threat-asset combinations."""
-    results = []
+) -> Dict[str, Any]:
+    """Calculate risk levels for all threats, column by column.
+
+    Returns a dict keyed like a risk result where each value holds one entry
+    per threat; numeric and risk level columns are NumPy arrays.
+    """
+    if not threats:
+        return {key: [] for key in _RESULT_KEYS}
+
+    max_severity, affected_ids, likelihoods, risk_levels = _score_threats(
+        assets, threats
+    )
+    severities = np.full(len(threats), max_severity, dtype=np.int64)
+
+    return {
+        "threat_id": [threat.sr_id for threat in threats],
+        "threat_ov": [threat.ov_id for threat in threats],
+        "strategic_path": [threat.strategic_path for threat in threats],
+        "operational_steps": [threat.operational_steps for threat in threats],
+        "likelihood_score": likelihoods,
+        "max_severity": severities,
+        "severity_score": severities,
+        "risk_level": risk_levels,
+        "affected_assets": [affected_ids] * len(threats),
+    }
 
-    for threat in threats:
-        # For each threat, calculate risk against all assets
-        # In a real implementation, you'd filter based on threat-asset relationships
-        max_severity = max(asset.severity_score() for asset in assets)
 
-        risk_level = threat.risk_level(max_severity)
-        likelihood = threat.likelihood_score()
+def iter_risk_levels(
+    assets: list[Asset], threats: list[Threat]
+) -> Iterator[Dict[str, Any]]:
+    """Yield one risk result dict per threat.
+
+    The threats are scored in one batch; each result is only built when it
+    is requested.
+    """
+    if not threats:
+        return
 
-        result = {
+    max_severity, affected_ids, likelihoods, risk_levels = _score_threats(
+        assets, threats
+    )
+    for threat, likelihood, risk_level in zip(threats, likelihoods, risk_levels):
+        yield {
             "threat_id": threat.sr_id,
             "threat_ov": threat.ov_id,
             "strategic_path": threat.strategic_path,
             "operational_steps": threat.operational_steps,
-            "likelihood_score": likelihood,
-            "max_severity": max_severity,  # Add this field for test compatibility
+            "likelihood_score": float(likelihood),
+            "max_severity": max_severity,
             "severity_score": max_severity,
             "risk_level": risk_level,
-            "affected_assets": [asset.id for asset in assets],  # Simplified
+            "affected_assets": affected_ids,
         }
 
-        results.append(result)
 
-    return results
+def calculate_risk_levels(
+    assets: list[Asset], threats: list[Threat]
+) -> list[Dict[str, Any]]:
+    """Calculate risk levels for all threat-asset combinations.
+
+    Row view of :func:`calculate_risk_columns`, one dict per threat.
+    """
+    return list(iter_risk_levels(assets, threats))
 
 
 def calculate_risks(*args, **kwargs):  # pragma: no cover
@@ -46,6 +134,44 @@ def calculate_risks(*args, **kwargs):  # pragma: no cover
     return calculate_risk_levels(*args, **kwargs)
 
 
+def _dump_models(report_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dump the model collections of ``report_data`` to plain dicts."""
+    return {
+        "assets": _ASSETS_TA.dump_python(report_data["assets"]),
+        "threats": _THREATS_TA.dump_python(report_data["threats"]),
+        "risk_sources": _RISK_SOURCES_TA.dump_python(report_data["risk_sources"]),
+        "objectives": _OBJECTIVES_TA.dump_python(report_data["objectives"]),
+        "stakeholders": _STAKEHOLDERS_TA.dump_python(report_data["stakeholders"]),
+        "measures": _MEASURES_TA.dump_python(report_data["measures"]),
+        "risk_results": report_data["risk_results"],
+        "settings": report_data["settings"].model_dump(),
+    }
+
+
+def _export_excel(report_data: Dict[str, Any], path: Path, pme_profile: bool) -> None:
+    exporters.export_excel(_dump_models(report_data), path, pme_profile=pme_profile)
+
+
+def _export_json(report_data: Dict[str, Any], path: Path, pme_profile: bool) -> None:
+    exporters.export_json_models(report_data, path)
+
+
+def _export_markdown(
+    report_data: Dict[str, Any], path: Path, pme_profile: bool
+) -> None:
+    exporters.export_markdown(_dump_models(report_data), path)
+
+
+# Format name -> (exporter, file extension)
+_EXPORTERS = {
+    "xlsx": (_export_excel, "xlsx"),
+    "excel": (_export_excel, "xlsx"),
+    "json": (_export_json, "json"),
+    "md": (_export_markdown, "md"),
+    "markdown": (_export_markdown, "md"),
+}
+
+
 def run(
     cfg_dir: Path,
     out_dir: Path,
@@ -58,7 +184,7 @@ def run(
 
     # Load all data
     assets, threats, settings, risk_sources, objectives, stakeholders, measures = (
-        loader.load_all(cfg_dir)
+        loader.load_all_cached(cfg_dir)
     )
 
     logger.info(f"Loaded {len(assets)} assets, {len(threats)} threats")
@@ -67,19 +193,29 @@ def run(
     )
     logger.info(f"Stakeholders: {len(stakeholders)}, Measures: {len(measures)}")
 
-    # Calculate risk levels
-    risk_results = calculate_risk_levels(assets, threats)
-
-    # Prepare export data
-    export_data = {
-        "assets": [asset.model_dump() for asset in assets],
-        "threats": [threat.model_dump() for threat in threats],
-        "risk_sources": [source.model_dump() for source in risk_sources],
-        "objectives": [obj.model_dump() for obj in objectives],
-        "stakeholders": [stakeholder.model_dump() for stakeholder in stakeholders],
-        "measures": [measure.model_dump() for measure in measures],
+    try:
+        export, extension = _EXPORTERS[fmt.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported format: {fmt}") from None
+
+    # Calculate risk levels; the Markdown report only tallies them, so it
+    # consumes the results one at a time instead of as a list
+    if export is _export_markdown:
+        risk_results = iter_risk_levels(assets, threats)
+    else:
+        risk_results = calculate_risk_levels(assets, threats)
+
+    # Prepare export data; models are only dumped to dicts by the exporters
+    # that need them
+    report_data = {
+        "assets": assets,
+        "threats": threats,
+        "risk_sources": risk_sources,
+        "objectives": objectives,
+        "stakeholders": stakeholders,
+        "measures": measures,
         "risk_results": risk_results,
-        "settings": settings.model_dump(),
+        "settings": settings,
     }
 
     # Ensure output directory exists
@@ -88,26 +224,10 @@ def run(
 
     # Determine output filename if not provided
     if not output_filename or output_filename == "ebios_risk_assessment.xlsx":
-        default_name = "ebios_risk_assessment"
-        if fmt.lower() in {"xlsx", "excel"}:
-            output_filename = f"{default_name}.xlsx"
-        elif fmt.lower() == "json":
-            output_filename = f"{default_name}.json"
-        elif fmt.lower() in {"md", "markdown"}:
-            output_filename = f"{default_name}.md"
-        else:
-            output_filename = f"{default_name}.{fmt.lower()}"
+        output_filename = f"ebios_risk_assessment.{extension}"
 
     # Export results
     output_file_path = out_path / output_filename
-
-    if fmt.lower() in {"xlsx", "excel"}:
-        exporters.export_excel(export_data, output_file_path, pme_profile=pme_profile)
-    elif fmt.lower() == "json":
-        exporters.export_json(export_data, output_file_path)
-    elif fmt.lower() in {"md", "markdown"}:
-        exporters.export_markdown(export_data, output_file_path)
-    else:
-        raise ValueError(f"Unsupported format: {fmt}")
+    export(report_data, output_file_path, pme_profile)
 
     logger.info(f"Report generated successfully in {output_file_path}")
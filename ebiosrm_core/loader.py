@@ -1,10 +1,16 @@
 """Data loading and validation functions."""
 
 import csv
+import os
+import re
 import yaml
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, Tuple
+
+from pydantic import TypeAdapter, ValidationError
 
 from .models import (
     Asset,
@@ -16,6 +22,145 @@ from .models import (
     Settings,
 )
 
+# Arrow's multithreaded C++ CSV reader is optional; pandas is the fallback
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Columns kept from referential files; others are dropped while parsing
+_REFERENTIAL_COLUMNS = (
+    "id",
+    "label",
+    "category",
+    "description",
+    "criticality",
+    "xref_iso",
+    "xref_nist",
+    "version",
+)
+
+# Referential files above this size are memory-mapped for the Arrow reader
+_MMAP_THRESHOLD = 16 << 20
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Read buffer for configuration files; fewer syscalls on large inventories
+_READ_BUFFER = 1 << 20
+
+# Comma-separated columns that are split into lists, per CSV file
+_THREAT_LIST_COLS = ("risk_sources", "targeted_objectives")
+_OBJECTIVE_LIST_COLS = ("target_assets", "attack_scenarios")
+_STAKEHOLDER_LIST_COLS = ("responsibilities",)
+_MEASURE_LIST_COLS = ("target_threats",)
+
+# Validate a whole file's rows in one pydantic-core call
+_ASSETS_TA = TypeAdapter(list[Asset])
+_THREATS_TA = TypeAdapter(list[Threat])
+_RISK_SOURCES_TA = TypeAdapter(list[RiskSource])
+_OBJECTIVES_TA = TypeAdapter(list[TargetedObjective])
+_STAKEHOLDERS_TA = TypeAdapter(list[Stakeholder])
+_MEASURES_TA = TypeAdapter(list[SecurityMeasure])
+
+
+def _read_referential(csv_file: Path):
+    """Read one referential CSV file.
+
+    Only the ``_REFERENTIAL_COLUMNS`` present in the file are read. Returns
+    an Arrow table when pyarrow is installed, else a DataFrame.
+    """
+    if pa is None:
+        return pd.read_csv(
+            csv_file,
+            encoding="utf-8-sig",
+            usecols=lambda column: column in _REFERENTIAL_COLUMNS,
+        )
+
+    # Arrow needs the projected columns by name, so read the header first
+    with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), [])
+    options = pacsv.ConvertOptions(
+        strings_can_be_null=True,
+        include_columns=[column for column in header if column in _REFERENTIAL_COLUMNS],
+    )
+    if csv_file.stat().st_size > _MMAP_THRESHOLD:
+        # Parse large files straight from the page cache instead of copying
+        # them through file reads
+        with pa.memory_map(str(csv_file)) as source:
+            table = pacsv.read_csv(source, convert_options=options)
+    else:
+        table = pacsv.read_csv(csv_file, convert_options=options)
+    # Keep dates such as version stamps as text, the way pandas reads them
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table
+
+
+def _set_text_column(frame, name: str, value: str):
+    """Set column ``name`` of a DataFrame or Arrow table to ``value``."""
+    if isinstance(frame, pd.DataFrame):
+        frame[name] = value
+        return frame
+
+    column = pa.array([value] * frame.num_rows, type=pa.string())
+    if name in frame.column_names:
+        return frame.set_column(frame.column_names.index(name), name, column)
+    return frame.append_column(name, column)
+
+
+def _concat_referentials(frames: list) -> pd.DataFrame:
+    """Concatenate the per-file frames into one DataFrame."""
+    if pa is None:
+        return pd.concat(frames, ignore_index=True)
+
+    # Merge as Arrow and convert to pandas once; files whose column types
+    # cannot be unified go through pandas instead
+    try:
+        table = pa.concat_tables(frames, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pd.concat([t.to_pandas() for t in frames], ignore_index=True)
+    return table.to_pandas()
+
+
+def _version_key(version) -> tuple[int, ...]:
+    """Return the numeric parts of a version, so "10.0" sorts after "2.0"."""
+    return tuple(int(part) for part in re.findall(r"\d+", str(version)))
+
+
+def _load_referential_file(csv_file: Path):
+    """Load one referential file tagged with its version and source file.
+
+    Manifest files (leading underscore) and unreadable files give ``None``.
+    """
+    if csv_file.name.startswith("_"):  # Skip manifest files
+        return None
+
+    try:
+        frame = _read_referential(csv_file)
+
+        # Extract version from filename if not in column
+        columns = frame.columns if pa is None else frame.column_names
+        if "version" not in columns:
+            file_name = csv_file.stem
+            if "_v" in file_name:
+                _, version = file_name.rsplit("_v", 1)
+                frame = _set_text_column(frame, "version", version)
+            else:
+                frame = _set_text_column(frame, "version", "1.0")
+
+        # Add source file for tracking
+        return _set_text_column(frame, "source_file", csv_file.name)
+
+    except Exception as e:
+        print(f"Warning: Could not load {csv_file}: {e}")
+        return None
+
 
 def load_referentials(config_dir: Path) -> pd.DataFrame:
     """Load and consolidate all referential CSV files.
@@ -42,45 +187,41 @@ def load_referentials(config_dir: Path) -> pd.DataFrame:
     if not csv_files:
         return pd.DataFrame()
 
-    all_dataframes = []
-
+    # Reuse the consolidated frame until a file is edited, added or removed
+    signature = []
     for csv_file in csv_files:
-        if csv_file.name.startswith("_"):  # Skip manifest files
-            continue
-
-        try:
-            # Load CSV with proper encoding handling
-            df = pd.read_csv(csv_file, encoding="utf-8-sig")
-
-            # Extract version from filename if not in column
-            if "version" not in df.columns:
-                file_name = csv_file.stem
-                if "_v" in file_name:
-                    _, version = file_name.rsplit("_v", 1)
-                    df["version"] = version
-                else:
-                    df["version"] = "1.0"
-
-            # Add source file for tracking
-            df["source_file"] = csv_file.name
-
-            all_dataframes.append(df)
-
-        except Exception as e:
-            print(f"Warning: Could not load {csv_file}: {e}")
-            continue
+        stat = csv_file.stat()
+        signature.append((csv_file.name, stat.st_mtime_ns, stat.st_size))
+    return _consolidate_referentials(str(referentials_dir), tuple(signature)).copy()
+
+
+@lru_cache(maxsize=4)
+def _consolidate_referentials(
+    referentials_dir: str, signature: tuple[tuple[str, int, int], ...]
+) -> pd.DataFrame:
+    csv_files = [Path(referentials_dir) / name for name, _, _ in signature]
+
+    # Files are independent and parsing releases the GIL, so read them in
+    # parallel; map keeps the original file order
+    with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as pool:
+        frames = [
+            frame
+            for frame in pool.map(_load_referential_file, csv_files)
+            if frame is not None
+        ]
 
-    if not all_dataframes:
+    if not frames:
         return pd.DataFrame()
 
-    # Concatenate all dataframes
-    df_combined = pd.concat(all_dataframes, ignore_index=True)
+    df_combined = _concat_referentials(frames)
 
     # Handle duplicates by keeping highest version
     if "id" in df_combined.columns and "version" in df_combined.columns:
-        # Sort by version (descending) and drop duplicates keeping first (highest version)
-        df_combined = df_combined.sort_values("version", ascending=False)
-        df_combined = df_combined.drop_duplicates(subset=["id"], keep="first")
+        # Rank the distinct versions numerically, then pick each ID's best row
+        keys = df_combined["version"].map(_version_key)
+        ranks = {key: rank for rank, key in enumerate(sorted(set(keys)))}
+        best = keys.map(ranks).groupby(df_combined["id"], dropna=False).idxmax()
+        df_combined = df_combined.loc[sorted(best)]
 
     # Reset index and ensure required columns exist
     df_combined = df_combined.reset_index(drop=True)
@@ -97,279 +238,339 @@ def load_referentials(config_dir: Path) -> pd.DataFrame:
         if col not in df_combined.columns:
             df_combined[col] = ""
 
+    # Few distinct values repeat across controls; store them dictionary-encoded
+    for col in ("category", "criticality", "xref_iso", "xref_nist"):
+        df_combined[col] = df_combined[col].astype("category")
+
     return df_combined
 
 
-def load_assets(config_dir: Path) -> list[Asset]:
-    """Load assets from CSV file."""
+def _header_index(fieldnames: list[str]) -> dict[str, int]:
+    """Map each non-blank header, stripped, to its column position."""
+    return {name.strip(): i for i, name in enumerate(fieldnames) if name.strip()}
+
+
+def _clean_rows(reader, index: dict[str, int]):
+    """Yield non-empty CSV rows as dicts of stripped values keyed by header.
+
+    Columns missing from a short row are empty strings; values beyond the
+    last header are dropped. Equal values share one string object for the
+    whole file, since categories and references repeat across rows.
+    """
+    intern = {}.setdefault
+    columns = tuple(index.items())
+    width = max(index.values(), default=-1) + 1
+    for row in reader:
+        if not row:
+            continue
+        n_values = len(row)
+        if n_values >= width:
+            # Complete row: no per-cell bounds check
+            yield {key: intern(value := row[i].strip(), value) for key, i in columns}
+        else:
+            yield {
+                key: intern(value := row[i].strip(), value) if i < n_values else ""
+                for key, i in columns
+            }
+
+
+def _list_columns(index: dict[str, int], columns: tuple[str, ...]) -> list[str]:
+    """Return the list columns from ``columns`` that the file actually has."""
+    return [column for column in columns if column in index]
+
+
+@lru_cache(maxsize=4096)
+def _split_list_value(value: str) -> tuple[str, ...]:
+    """Split one comma-separated cell; reference lists repeat across rows."""
+    return tuple(x.strip() for x in value.split(","))
+
+
+def _split_lists(clean_row: dict, columns: list[str]) -> dict:
+    """Split the comma-separated ``columns`` of a cleaned row in place.
+
+    Values become tuples, which validation turns into the models' lists.
+    """
+    for column in columns:
+        value = clean_row[column]
+        if value:
+            clean_row[column] = _split_list_value(value)
+    return clean_row
+
+
+def _validate_rows(adapter: TypeAdapter, model, rows: list[dict], source: Path):
+    """Validate all rows at once, reporting the first bad row by number.
+
+    On failure the offending row is validated again on its own so the error
+    reads the same as a per-row ``model(**row)`` call.
+    """
+    try:
+        return adapter.validate_python(rows)
+    except ValidationError as e:
+        row_num = e.errors()[0]["loc"][0]
+        try:
+            model(**rows[row_num])
+        except Exception as row_error:
+            raise ValueError(
+                f"Error processing row {row_num + 1} in {source}: {row_error}"
+            )
+        raise
+
+
+def _file_present(path: Path, present: set[str] | None) -> bool:
+    """Check ``path`` exists, using the directory listing ``present`` if given."""
+    return path.exists() if present is None else path.name in present
+
+
+def _collect_duplicates(ids, duplicates: list[str]) -> None:
+    """Append each ID that occurs more than once to ``duplicates``, once."""
+    seen: set[str] = set()
+    for item_id in ids:
+        if item_id in seen and item_id not in duplicates:
+            duplicates.append(item_id)
+        seen.add(item_id)
+
+
+def load_assets(
+    config_dir: Path,
+    duplicates: list[str] | None = None,
+    present: set[str] | None = None,
+) -> list[Asset]:
+    """Load assets from CSV file.
+
+    If ``duplicates`` is given, IDs seen more than once are appended to it.
+    ``present`` is an optional listing of the directory's file names used
+    instead of checking the file on disk.
+    """
     assets_file = config_dir / "assets.csv"
-    if not assets_file.exists():
+    if not _file_present(assets_file, present):
         raise FileNotFoundError(f"Assets file not found: {assets_file}")
 
-    assets = []
-    with open(assets_file, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(
+        assets_file, "r", encoding="utf-8-sig", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
 
         # Validate headers
-        if reader.fieldnames is None:
+        if fieldnames is None:
             raise ValueError(f"No headers found in {assets_file}")
 
         # Check required columns before processing rows
         required = {"id", "type", "label", "criticality"}
-        if not required.issubset(set(reader.fieldnames)):
-            missing = required - set(reader.fieldnames)
+        if not required.issubset(set(fieldnames)):
+            missing = required - set(fieldnames)
             raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
 
-        for row_num, row in enumerate(reader):
-            try:
-                # Clean the row data - ensure all keys are strings
-                clean_row = {}
-                for key, value in row.items():
-                    if key is None or not isinstance(key, str) or not key.strip():
-                        continue  # Skip invalid keys
+        rows = list(_clean_rows(reader, _header_index(fieldnames)))
 
-                    clean_key = str(key).strip()
-                    clean_value = str(value).strip() if value is not None else ""
-                    clean_row[clean_key] = clean_value
-
-                assets.append(Asset(**clean_row))
-            except Exception as e:
-                raise ValueError(
-                    f"Error processing row {row_num + 1} in {assets_file}: {e}"
-                )
+    assets = _validate_rows(_ASSETS_TA, Asset, rows, assets_file)
+    if duplicates is not None:
+        _collect_duplicates((asset.id for asset in assets), duplicates)
 
     return assets
 
 
-def load_threats(config_dir: Path) -> list[Threat]:
-    """Load threats from CSV file."""
+def load_threats(
+    config_dir: Path,
+    duplicates: list[str] | None = None,
+    present: set[str] | None = None,
+) -> list[Threat]:
+    """Load threats from CSV file.
+
+    If ``duplicates`` is given, IDs seen more than once are appended to it.
+    ``present`` is an optional listing of the directory's file names used
+    instead of checking the file on disk.
+    """
     threats_file = config_dir / "threats.csv"
-    if not threats_file.exists():
+    if not _file_present(threats_file, present):
         raise FileNotFoundError(f"Threats file not found: {threats_file}")
 
-    threats = []
-    with open(threats_file, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(
+        threats_file, "r", encoding="utf-8-sig", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
 
         # Validate headers
-        if reader.fieldnames is None:
+        if fieldnames is None:
             raise ValueError(f"No headers found in {threats_file}")
 
-        # Check for invalid headers (None or non-string) and filter them out
-        valid_headers = [
-            h
-            for h in reader.fieldnames
-            if h is not None and isinstance(h, str) and h.strip()
-        ]
-        invalid_headers = [
-            h
-            for h in reader.fieldnames
-            if h is None or not isinstance(h, str) or not h.strip()
-        ]
-
+        # Blank headers are filtered out
+        invalid_headers = [h for h in fieldnames if not h.strip()]
         if invalid_headers:
             print(
                 f"Warning: Ignoring invalid headers in {threats_file}: {invalid_headers}"
             )
 
-        for row_num, row in enumerate(reader):
-            try:
-                # Clean the row data - only use valid headers and ensure all keys are strings
-                clean_row = {}
-                for key, value in row.items():
-                    if key is None or not isinstance(key, str) or not key.strip():
-                        continue  # Skip invalid keys
-
-                    clean_key = str(key).strip()
-                    if clean_key in valid_headers:
-                        clean_value = str(value).strip() if value is not None else ""
-                        clean_row[clean_key] = clean_value
-
-                # Ensure we have the required fields
-                required_fields = [
-                    "sr_id",
-                    "ov_id",
-                    "strategic_path",
-                    "operational_steps",
-                ]
-                missing_fields = [
-                    field for field in required_fields if field not in clean_row
-                ]
-                if missing_fields:
-                    raise ValueError(f"Missing required fields: {missing_fields}")
-
-                # Handle optional list fields
-                if "risk_sources" in clean_row and clean_row["risk_sources"]:
-                    clean_row["risk_sources"] = [
-                        x.strip() for x in clean_row["risk_sources"].split(",")
-                    ]
-                if (
-                    "targeted_objectives" in clean_row
-                    and clean_row["targeted_objectives"]
-                ):
-                    clean_row["targeted_objectives"] = [
-                        x.strip() for x in clean_row["targeted_objectives"].split(",")
-                    ]
-
-                threats.append(Threat(**clean_row))
-            except Exception as e:
-                raise ValueError(
-                    f"Error processing row {row_num + 1} in {threats_file}: {e}"
-                )
+        index = _header_index(fieldnames)
+
+        # Every row carries every header, so resolve required and list
+        # columns once instead of per row
+        required_fields = ["sr_id", "ov_id", "strategic_path", "operational_steps"]
+        missing_fields = [field for field in required_fields if field not in index]
+        list_columns = _list_columns(index, _THREAT_LIST_COLS)
+
+        # Handle optional list fields
+        rows = [
+            _split_lists(clean_row, list_columns)
+            for clean_row in _clean_rows(reader, index)
+        ]
+
+    # Ensure we have the required fields
+    if missing_fields and rows:
+        raise ValueError(
+            f"Error processing row 1 in {threats_file}: "
+            f"Missing required fields: {missing_fields}"
+        )
+
+    threats = _validate_rows(_THREATS_TA, Threat, rows, threats_file)
+    if duplicates is not None:
+        _collect_duplicates((threat.sr_id for threat in threats), duplicates)
 
     return threats
 
 
-def load_risk_sources(config_dir: Path) -> list[RiskSource]:
+def load_risk_sources(
+    config_dir: Path, present: set[str] | None = None
+) -> list[RiskSource]:
     """Load risk sources from CSV file."""
     sources_file = config_dir / "risk_sources.csv"
-    if not sources_file.exists():
+    if not _file_present(sources_file, present):
         return []  # Optional file
 
-    sources = []
-    with open(sources_file, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            sources.append(RiskSource(**row))
+    with open(
+        sources_file, "r", encoding="utf-8", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+
+        if fieldnames is None:
+            return []  # Empty file is OK for optional files
+
+        rows = list(_clean_rows(reader, _header_index(fieldnames)))
 
-    return sources
+    return _RISK_SOURCES_TA.validate_python(rows)
 
 
-def load_objectives(config_dir: Path) -> list[TargetedObjective]:
-    """Load targeted objectives from CSV file."""
+def load_objectives(
+    config_dir: Path,
+    duplicates: list[str] | None = None,
+    present: set[str] | None = None,
+) -> list[TargetedObjective]:
+    """Load targeted objectives from CSV file.
+
+    If ``duplicates`` is given, IDs seen more than once are appended to it.
+    ``present`` is an optional listing of the directory's file names used
+    instead of checking the file on disk.
+    """
     objectives_file = config_dir / "objectives.csv"
-    if not objectives_file.exists():
+    if not _file_present(objectives_file, present):
         return []  # Optional file
 
-    objectives = []
-    with open(objectives_file, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(
+        objectives_file, "r", encoding="utf-8-sig", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
 
         # Validate headers
-        if reader.fieldnames is None:
+        if fieldnames is None:
             raise ValueError(f"No headers found in {objectives_file}")
 
-        for row_num, row in enumerate(reader):
-            try:
-                # Clean the row data - ensure all keys are strings
-                clean_row = {}
-                for key, value in row.items():
-                    if key is None or not isinstance(key, str) or not key.strip():
-                        continue  # Skip invalid keys
-
-                    clean_key = str(key).strip()
-                    clean_value = str(value).strip() if value is not None else ""
-                    clean_row[clean_key] = clean_value
-
-                # Handle list fields
-                if "target_assets" in clean_row and clean_row["target_assets"]:
-                    clean_row["target_assets"] = [
-                        x.strip() for x in clean_row["target_assets"].split(",")
-                    ]
-                if "attack_scenarios" in clean_row and clean_row["attack_scenarios"]:
-                    clean_row["attack_scenarios"] = [
-                        x.strip() for x in clean_row["attack_scenarios"].split(",")
-                    ]
-
-                objectives.append(TargetedObjective(**clean_row))
-            except Exception as e:
-                raise ValueError(
-                    f"Error processing row {row_num + 1} in {objectives_file}: {e}"
-                )
+        index = _header_index(fieldnames)
+        list_columns = _list_columns(index, _OBJECTIVE_LIST_COLS)
+
+        # Handle list fields
+        rows = [
+            _split_lists(clean_row, list_columns)
+            for clean_row in _clean_rows(reader, index)
+        ]
+
+    objectives = _validate_rows(
+        _OBJECTIVES_TA, TargetedObjective, rows, objectives_file
+    )
+    if duplicates is not None:
+        _collect_duplicates((objective.id for objective in objectives), duplicates)
 
     return objectives
 
 
-def load_stakeholders(config_dir: Path) -> list[Stakeholder]:
+def load_stakeholders(
+    config_dir: Path, present: set[str] | None = None
+) -> list[Stakeholder]:
     """Load stakeholders from CSV file."""
     stakeholders_file = config_dir / "stakeholders.csv"
-    if not stakeholders_file.exists():
+    if not _file_present(stakeholders_file, present):
         return []  # Optional file
 
-    stakeholders = []
-    with open(stakeholders_file, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(
+        stakeholders_file, "r", encoding="utf-8-sig", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
 
         # Validate headers
-        if reader.fieldnames is None:
+        if fieldnames is None:
             return []  # Empty file is OK for optional files
 
-        for row_num, row in enumerate(reader):
-            try:
-                # Clean the row data - ensure all keys are strings
-                clean_row = {}
-                for key, value in row.items():
-                    if key is None or not isinstance(key, str) or not key.strip():
-                        continue  # Skip invalid keys
-
-                    clean_key = str(key).strip()
-                    clean_value = str(value).strip() if value is not None else ""
-                    clean_row[clean_key] = clean_value
+        index = _header_index(fieldnames)
+        list_columns = _list_columns(index, _STAKEHOLDER_LIST_COLS)
 
-                # Handle list fields
-                if "responsibilities" in clean_row and clean_row["responsibilities"]:
-                    clean_row["responsibilities"] = [
-                        x.strip() for x in clean_row["responsibilities"].split(",")
-                    ]
-
-                stakeholders.append(Stakeholder(**clean_row))
-            except Exception as e:
-                raise ValueError(
-                    f"Error processing row {row_num + 1} in {stakeholders_file}: {e}"
-                )
+        # Handle list fields
+        rows = [
+            _split_lists(clean_row, list_columns)
+            for clean_row in _clean_rows(reader, index)
+        ]
 
-    return stakeholders
+    return _validate_rows(_STAKEHOLDERS_TA, Stakeholder, rows, stakeholders_file)
 
 
-def load_measures(config_dir: Path) -> list[SecurityMeasure]:
+def load_measures(
+    config_dir: Path, present: set[str] | None = None
+) -> list[SecurityMeasure]:
     """Load security measures from CSV file."""
     measures_file = config_dir / "measures.csv"
-    if not measures_file.exists():
+    if not _file_present(measures_file, present):
         return []  # Optional file
 
-    measures = []
-    with open(measures_file, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(
+        measures_file, "r", encoding="utf-8-sig", newline="", buffering=_READ_BUFFER
+    ) as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
 
         # Validate headers
-        if reader.fieldnames is None:
+        if fieldnames is None:
             return []  # Empty file is OK for optional files
 
-        for row_num, row in enumerate(reader):
-            try:
-                # Clean the row data - ensure all keys are strings
-                clean_row = {}
-                for key, value in row.items():
-                    if key is None or not isinstance(key, str) or not key.strip():
-                        continue  # Skip invalid keys
-
-                    clean_key = str(key).strip()
-                    clean_value = str(value).strip() if value is not None else ""
-                    clean_row[clean_key] = clean_value
-
-                # Handle list fields
-                if "target_threats" in clean_row and clean_row["target_threats"]:
-                    clean_row["target_threats"] = [
-                        x.strip() for x in clean_row["target_threats"].split(",")
-                    ]
+        index = _header_index(fieldnames)
+        list_columns = _list_columns(index, _MEASURE_LIST_COLS)
 
-                measures.append(SecurityMeasure(**clean_row))
-            except Exception as e:
-                raise ValueError(
-                    f"Error processing row {row_num + 1} in {measures_file}: {e}"
-                )
+        # Handle list fields
+        rows = [
+            _split_lists(clean_row, list_columns)
+            for clean_row in _clean_rows(reader, index)
+        ]
 
-    return measures
+    return _validate_rows(_MEASURES_TA, SecurityMeasure, rows, measures_file)
 
 
-def load_settings(config_dir: Path) -> Settings:
+def load_settings(config_dir: Path, present: set[str] | None = None) -> Settings:
     """Load settings from YAML file."""
     settings_file = config_dir / "settings.yaml"
-    if not settings_file.exists():
+    if not _file_present(settings_file, present):
         return Settings()  # Use defaults
 
-    with open(settings_file, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Parse the YAML again only when the file changes; callers get a copy
+    stat = settings_file.stat()
+    settings = _read_settings(str(settings_file), stat.st_mtime_ns, stat.st_size)
+    return settings.model_copy(deep=True)
+
+
+@lru_cache(maxsize=16)
+def _read_settings(settings_file: str, mtime_ns: int, size: int) -> Settings:
+    with open(settings_file, "r", encoding="utf-8", buffering=_READ_BUFFER) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
 
     return Settings(**data)
 
@@ -390,17 +591,84 @@ def load_all(
     Returns:
         Tuple with all loaded data (7 components)
     """
+    return load_all_with_report(config_dir)[:-1]
+
+
+def load_all_with_report(
+    config_dir: Path,
+) -> Tuple[
+    list[Asset],
+    list[Threat],
+    Settings,
+    list[RiskSource],
+    list[TargetedObjective],
+    list[Stakeholder],
+    list[SecurityMeasure],
+    Dict[str, list[str]],
+]:
+    """Load all configuration data and report duplicate IDs.
+
+    Duplicates are collected while the CSV files are parsed, keyed by
+    ``"asset"``, ``"threat"`` and ``"objective"``.
+
+    Returns:
+        Tuple with all loaded data plus the duplicate report (8 components)
+    """
     config_path = Path(config_dir)
+    dup_report: Dict[str, list[str]] = {"asset": [], "threat": [], "objective": []}
+
+    # List the directory once instead of stat-ing each file in its loader
+    try:
+        with os.scandir(config_path) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
+
+    # The files are independent, so read them concurrently; each loader
+    # appends to its own duplicate list
+    with ThreadPoolExecutor(max_workers=7) as pool:
+        futures = [
+            pool.submit(load_assets, config_path, dup_report["asset"], present),
+            pool.submit(load_threats, config_path, dup_report["threat"], present),
+            pool.submit(load_settings, config_path, present),
+            pool.submit(load_risk_sources, config_path, present),
+            pool.submit(load_objectives, config_path, dup_report["objective"], present),
+            pool.submit(load_stakeholders, config_path, present),
+            pool.submit(load_measures, config_path, present),
+        ]
+        results = [future.result() for future in futures]
+
+    return (*results, dup_report)
+
+
+def _config_signature(config_path: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return ``(name, mtime_ns, size)`` for every file in the directory."""
+    signature = []
+    for p in sorted(config_path.glob("*")):
+        stat = p.stat()
+        signature.append((p.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
 
-    assets = load_assets(config_path)
-    threats = load_threats(config_path)
-    settings = load_settings(config_path)
-    risk_sources = load_risk_sources(config_path)
-    objectives = load_objectives(config_path)
-    stakeholders = load_stakeholders(config_path)
-    measures = load_measures(config_path)
+@lru_cache(maxsize=4)
+def _load_all_cached(config_dir: str, signature: tuple[tuple[str, int, int], ...]):
+    return load_all_with_report(Path(config_dir))
 
-    return assets, threats, settings, risk_sources, objectives, stakeholders, measures
+
+def load_all_cached(config_dir: Path, with_report: bool = False):
+    """Memoized :func:`load_all` for repeated calls in one process.
+
+    The cache key includes the name, modification time and size of every file
+    in the configuration directory, so editing, adding or removing a file
+    there invalidates the cached result.
+    The returned lists are shared between callers and must not be mutated.
+    With ``with_report=True`` the result matches :func:`load_all_with_report`.
+    """
+    config_path = Path(config_dir)
+    result = _load_all_cached(
+        str(config_path.resolve()), _config_signature(config_path)
+    )
+    return result if with_report else result[:-1]
 
 
 def load_all_with_referentials(
@@ -422,22 +690,10 @@ def load_all_with_referentials(
     """
     config_path = Path(config_dir)
 
-    assets = load_assets(config_path)
-    threats = load_threats(config_path)
-    settings = load_settings(config_path)
-    risk_sources = load_risk_sources(config_path)
-    objectives = load_objectives(config_path)
-    stakeholders = load_stakeholders(config_path)
-    measures = load_measures(config_path)
-    referentials = load_referentials(config_path)
-
-    return (
-        assets,
-        threats,
-        settings,
-        risk_sources,
-        objectives,
-        stakeholders,
-        measures,
-        referentials,
-    )
+    # Consolidate the referentials while load_all reads the other files in
+    # its own pool
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        referentials = pool.submit(load_referentials, config_path)
+        data = load_all(config_path)
+
+    return (*data, referentials.result())
@@ -2,9 +2,38 @@
 
 from __future__ import annotations
 
+import re
 from enum import Enum
+
+import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
+from ._kernels import risk_codes, step_means
+
+# Risk matrix: severity (rows) x likelihood (cols)
+_RISK_MATRIX = [
+    ["Low", "Low", "Medium", "High"],  # Low severity
+    ["Low", "Medium", "Medium", "High"],  # Medium severity
+    ["Medium", "Medium", "High", "Critical"],  # High severity
+    ["Medium", "High", "Critical", "Critical"],  # Critical severity
+]
+
+# Row-major flat copy of the matrix for scalar lookups
+_RISK_FLAT = tuple(level for row in _RISK_MATRIX for level in row)
+
+# The same matrix as integer codes into _RISK_LEVELS, for the batched kernel
+_RISK_LEVELS = np.array(["Low", "Medium", "High", "Critical"], dtype=object)
+_RISK_CODES = np.array(
+    [[list(_RISK_LEVELS).index(level) for level in row] for row in _RISK_MATRIX],
+    dtype=np.int8,
+)
+
+
+# Level of each "Step:Level" pair in operational steps; a pair only counts
+# when the text after its first colon is exactly one of the levels
+_STEP_RE = re.compile(r"(?:^|,)[^:,]*:\s*(Low|Medium|High|Critical)\s*(?=,|$)")
+_STEP_SCORES = {"Low": 1, "Medium": 2, "High": 3, "Critical": 4}
+
 
 class CriticalityLevel(str, Enum):
     """Asset criticality levels."""
@@ -15,6 +44,15 @@ class CriticalityLevel(str, Enum):
     CRITICAL = "Critical"
 
 
+# Numeric severity score (1-4) of each criticality level
+_SEVERITY = {
+    CriticalityLevel.LOW: 1,
+    CriticalityLevel.MEDIUM: 2,
+    CriticalityLevel.HIGH: 3,
+    CriticalityLevel.CRITICAL: 4,
+}
+
+
 class LikelihoodLevel(str, Enum):
     """Threat likelihood levels."""
 
@@ -52,13 +90,16 @@ class Asset(BaseModel):
 
     def severity_score(self) -> int:
         """Convert criticality to numeric score (1-4)."""
-        mapping = {
-            CriticalityLevel.LOW: 1,
-            CriticalityLevel.MEDIUM: 2,
-            CriticalityLevel.HIGH: 3,
-            CriticalityLevel.CRITICAL: 4,
-        }
-        return mapping[self.criticality]
+        return _SEVERITY[self.criticality]
+
+    @staticmethod
+    def severity_vector(assets: list[Asset]) -> np.ndarray:
+        """Return the severity score of each asset as an int8 array."""
+        return np.fromiter(
+            (_SEVERITY[asset.criticality] for asset in assets),
+            dtype=np.int8,
+            count=len(assets),
+        )
 
 
 class RiskSource(BaseModel):
@@ -142,18 +183,9 @@ class Threat(BaseModel):
 
     def likelihood_score(self) -> float:
         """Calculate weighted likelihood from operational steps."""
-        step_mapping = {"Low": 1, "Medium": 2, "High": 3, "Critical": 4}
-
-        steps = [s.strip() for s in self.operational_steps.split(",")]
-        scores = []
-
-        for step in steps:
-            if ":" not in step:
-                continue
-            _, level = step.split(":", 1)
-            level = level.strip()
-            if level in step_mapping:
-                scores.append(step_mapping[level])
+        scores = [
+            _STEP_SCORES[level] for level in _STEP_RE.findall(self.operational_steps)
+        ]
 
         return sum(scores) / len(scores) if scores else 1.0
 
@@ -162,18 +194,42 @@ class Threat(BaseModel):
         likelihood = self.likelihood_score()
         severity = max_asset_severity
 
-        # Risk matrix: severity (rows) x likelihood (cols)
-        matrix = [
-            ["Low", "Low", "Medium", "High"],  # Low severity
-            ["Low", "Medium", "Medium", "High"],  # Medium severity
-            ["Medium", "Medium", "High", "Critical"],  # High severity
-            ["Medium", "High", "Critical", "Critical"],  # Critical severity
-        ]
-
         sev_idx = min(int(severity) - 1, 3)
         lik_idx = min(int(likelihood) - 1, 3)
 
-        return matrix[sev_idx][lik_idx]
+        return _RISK_FLAT[sev_idx * 4 + lik_idx]
+
+    @staticmethod
+    def likelihood_vector(threats: list[Threat]) -> np.ndarray:
+        """Return the likelihood score of each threat as a float array.
+
+        Step levels are packed into a -1 padded code matrix and averaged by
+        one kernel call.
+        """
+        levels = [_STEP_RE.findall(threat.operational_steps) for threat in threats]
+        step_codes = np.full(
+            (len(threats), max(map(len, levels), default=0)), -1, dtype=np.int8
+        )
+        for row, steps in enumerate(levels):
+            step_codes[row, : len(steps)] = [_STEP_SCORES[level] for level in steps]
+        return step_means(step_codes)
+
+    @staticmethod
+    def risk_vector(
+        threats: list[Threat],
+        max_asset_severity: int,
+        likelihoods: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Rate every threat against the same severity in one matrix lookup.
+
+        Pass ``likelihoods`` from :meth:`likelihood_vector` to avoid
+        re-parsing the operational steps.
+        """
+        if likelihoods is None:
+            likelihoods = Threat.likelihood_vector(threats)
+
+        sev_idx = min(int(max_asset_severity) - 1, 3)
+        return _RISK_LEVELS[risk_codes(likelihoods, sev_idx, _RISK_CODES)]
 
 
 class Settings(BaseModel):
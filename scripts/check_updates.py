@@ -1,6 +1,8 @@
 """Automated referential update detection and PR creation script.
 
 Calculates SHA-256 hashes for each CSV line and compares against manifest.
+Files whose modification time and size match the stats saved with the
+manifest, or whose whole-file hash is unchanged, are not re-hashed per row.
 Creates branches and pull requests for new updates via GitHub REST API.
 
 References:
@@ -10,14 +12,92 @@ References:
 """
 
 import hashlib
+import io
 import json
 import csv
 import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
+# Columns that identify a control's content (the version column is excluded)
+HASH_FIELDS = (
+    "id",
+    "label",
+    "category",
+    "description",
+    "criticality",
+    "xref_iso",
+    "xref_nist",
+)
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write ``data`` as indented JSON with sorted keys, for stable git diffs."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+
+
+def _batch_sha256(payloads: List[bytes]) -> List[str]:
+    """Return the SHA-256 hex digest of each payload."""
+    sha256 = hashlib.sha256
+    return [sha256(payload).hexdigest() for payload in payloads]
+
+
+def _scan_one(csv_file: Path) -> Tuple[List[str], List[str], str]:
+    """Hash every row of one referential CSV file.
+
+    Returns:
+        Tuple of (row_ids, row_hashes, file_sha256)
+    """
+    data = csv_file.read_bytes()
+    text = data.decode("utf-8-sig")
+    reader = csv.reader(io.StringIO(text, newline=""))
+    header = next(reader, [])
+    rows = [row for row in reader if row]
+
+    # Resolve the hashed columns once. Rows are cut to the header width plus
+    # one trailing "" that stands in for absent columns
+    width = len(header)
+    field_idx = tuple(
+        header.index(field) if field in header else width for field in HASH_FIELDS
+    )
+    rows = [(row + [""] * width)[:width] + [""] for row in rows]
+
+    # Build every row payload first, then hash the file in one batch
+    if "id" in header:
+        id_idx = header.index("id")
+        row_ids = [row[id_idx] for row in rows]
+    else:
+        row_ids = [f"{csv_file.stem}_{n}" for n in range(2, len(rows) + 2)]
+    payloads = [";".join([row[i] for i in field_idx]).encode("utf-8") for row in rows]
+
+    return row_ids, _batch_sha256(payloads), hashlib.sha256(data).hexdigest()
 
 
 class ReferentialUpdater:
@@ -27,51 +107,60 @@ class ReferentialUpdater:
         self.config_dir = config_dir
         self.referentials_dir = config_dir / "referentials"
         self.manifest_path = self.referentials_dir / "_checksums.json"
+        self.file_stats_path = self.referentials_dir / "_file_stats.json"
         self.dry_run = dry_run
 
+        # Per-file stats from the last scan, saved alongside the manifest
+        self._file_stats: Dict[str, Dict[str, Any]] = {}
+
         # GitHub configuration (set via environment variables)
         self.github_token = os.getenv("GITHUB_TOKEN")
         self.repo_owner = os.getenv("GITHUB_REPO_OWNER", "default-owner")
         self.repo_name = os.getenv("GITHUB_REPO_NAME", "AR")
 
-    def calculate_line_hash(self, row_data: Dict[str, str]) -> str:
-        """Calculate SHA-256 hash for a CSV row.
-
-        Args:
-            row_data: Dictionary containing CSV row data
-
-        Returns:
-            SHA-256 hash string
-
-        Reference:
-            SHA-256 hash comparison in Python (GeeksforGeeks)
-        """
-        # Create consistent string from row data (excluding version column)
-        hash_fields = [
-            "id",
-            "label",
-            "category",
-            "description",
-            "criticality",
-            "xref_iso",
-            "xref_nist",
-        ]
-        hash_string = ";".join(row_data.get(field, "") for field in hash_fields)
-
-        return hashlib.sha256(hash_string.encode("utf-8")).hexdigest()
+        # One pooled connection to the GitHub API shared by all PR requests.
+        # Only idempotent methods are retried after a response or a timeout;
+        # a POST that reached GitHub may already have created the PR, so it is
+        # retried only on connection errors.
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        )
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry),
+        )
+        self._pr_headers = {
+            "Authorization": f"token {self.github_token}",
+            "Accept": "application/vnd.github.v3+json",
+            "Content-Type": "application/json",
+        }
 
     def load_manifest(self) -> Dict[str, str]:
         """Load existing checksums manifest."""
         if not self.manifest_path.exists():
             return {}
 
-        with open(self.manifest_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _read_json(self.manifest_path)
+
+    def load_file_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load the per-file stats recorded with the manifest."""
+        if not self.file_stats_path.exists():
+            return {}
+
+        return _read_json(self.file_stats_path)
+
+    def save_file_stats(self) -> None:
+        """Save the per-file stats gathered by the last scan."""
+        _write_json(self.file_stats_path, self._file_stats)
 
     def save_manifest(self, checksums: Dict[str, str]) -> None:
-        """Save updated checksums manifest."""
-        with open(self.manifest_path, "w", encoding="utf-8") as f:
-            json.dump(checksums, f, indent=2, ensure_ascii=False)
+        """Save updated checksums manifest and the matching file stats."""
+        _write_json(self.manifest_path, checksums)
+        self.save_file_stats()
 
     def scan_referentials(self) -> Tuple[List[str], Dict[str, str]]:
         """Scan all referential CSV files and detect changes.
@@ -80,33 +169,78 @@ class ReferentialUpdater:
             Tuple of (new_files, updated_checksums)
         """
         current_checksums = self.load_manifest()
+        file_stats = self.load_file_stats()
         new_checksums = {}
+        new_file_stats = {}
         new_files = []
 
-        # Scan all CSV files in referentials directory
+        # A file with the same mtime and size as when the manifest was saved
+        # keeps its row checksums without being re-read; a touched file whose
+        # bytes still hash the same keeps them too
+        files = []
         for csv_file in self.referentials_dir.glob("*.csv"):
             if csv_file.name.startswith("_"):  # Skip manifest and other meta files
                 continue
 
-            print(f"🔍 Scanning {csv_file.name}...")
-
-            with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
-                reader = csv.DictReader(f)
-
-                for row_num, row in enumerate(reader, 2):
-                    row_id = row.get("id", f"{csv_file.stem}_{row_num}")
-                    row_hash = self.calculate_line_hash(row)
-
-                    new_checksums[row_id] = row_hash
+            stat = csv_file.stat()
+            cached = file_stats.get(csv_file.name)
+            if cached and not all(
+                row_id in current_checksums for row_id in cached["rows"]
+            ):
+                cached = None
+            if cached and (
+                cached["mtime_ns"] != stat.st_mtime_ns or cached["size"] != stat.st_size
+            ):
+                file_sha256 = hashlib.sha256(csv_file.read_bytes()).hexdigest()
+                if file_sha256 == cached["sha256"]:
+                    cached = {
+                        **cached,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                    }
+                else:
+                    cached = None
+            files.append((csv_file, stat, cached))
+
+        # Files are independent, so hash them in separate processes
+        to_scan = [csv_file for csv_file, _, cached in files if cached is None]
+        if len(to_scan) > 1:
+            workers = min(len(to_scan), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scanned = dict(zip(to_scan, pool.map(_scan_one, to_scan)))
+        else:
+            scanned = {csv_file: _scan_one(csv_file) for csv_file in to_scan}
+
+        for csv_file, stat, cached in files:
+            if cached is not None:
+                print(f"⏭️  Unchanged {csv_file.name}")
+                for row_id in cached["rows"]:
+                    new_checksums[row_id] = current_checksums[row_id]
+                new_file_stats[csv_file.name] = cached
+                continue
 
-                    # Check if this is a new or updated entry
-                    if row_id not in current_checksums:
-                        print(f"  ✨ New entry: {row_id}")
-                        new_files.append(csv_file.name)
-                    elif current_checksums[row_id] != row_hash:
-                        print(f"  🔄 Updated entry: {row_id}")
-                        new_files.append(csv_file.name)
+            print(f"🔍 Scanning {csv_file.name}...")
 
+            row_ids, row_hashes, file_sha256 = scanned[csv_file]
+            for row_id, row_hash in zip(row_ids, row_hashes):
+                new_checksums[row_id] = row_hash
+
+                # Check if this is a new or updated entry
+                if row_id not in current_checksums:
+                    print(f"  ✨ New entry: {row_id}")
+                    new_files.append(csv_file.name)
+                elif current_checksums[row_id] != row_hash:
+                    print(f"  🔄 Updated entry: {row_id}")
+                    new_files.append(csv_file.name)
+
+            new_file_stats[csv_file.name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": file_sha256,
+                "rows": row_ids,
+            }
+
+        self._file_stats = new_file_stats
         return list(set(new_files)), new_checksums
 
     def create_update_branch(self, referential_name: str) -> str:
@@ -148,6 +282,28 @@ class ReferentialUpdater:
         else:
             print(f"🔄 [DRY RUN] Would commit: {commit_msg}")
 
+    def commit_batch_changes(
+        self, updates: List[Tuple[str, str]], files: List[Path]
+    ) -> None:
+        """Commit several referential updates in a single commit.
+
+        Args:
+            updates: (referential_name, version) pairs
+            files: Changed referential files to stage
+        """
+        summary = ", ".join(f"{name} v{version}" for name, version in updates)
+        commit_msg = f"feat(referentials): update {summary}"
+
+        if not self.dry_run:
+            try:
+                subprocess.run(["git", "add", *map(str, files)], check=True)
+                subprocess.run(["git", "commit", "-m", commit_msg], check=True)
+                print(f"✅ Committed changes: {commit_msg}")
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Failed to commit: {e}")
+        else:
+            print(f"🔄 [DRY RUN] Would commit: {commit_msg}")
+
     def create_pull_request(
         self, branch_name: str, referential_name: str, version: str
     ) -> Optional[str]:
@@ -164,6 +320,38 @@ class ReferentialUpdater:
         Reference:
             GitHub REST API Pull Requests: https://docs.github.com/en/rest/pulls/pulls
         """
+        return self._submit_pull_request(
+            branch_name,
+            f"feat(referential): update {referential_name} to v{version}",
+            f"**Referential:** {referential_name}\n**Version:** {version}",
+            f"{referential_name} v{version}",
+        )
+
+    def create_batch_pull_request(
+        self, branch_name: str, updates: List[Tuple[str, str]]
+    ) -> Optional[str]:
+        """Create one pull request covering several referential updates.
+
+        Args:
+            branch_name: Source branch name
+            updates: (referential_name, version) pairs
+
+        Returns:
+            PR URL if successful
+        """
+        summary = ", ".join(f"{name} v{version}" for name, version in updates)
+        listing = "\n".join(f"- {name} v{version}" for name, version in updates)
+        return self._submit_pull_request(
+            branch_name,
+            f"feat(referentials): update {summary}",
+            f"**Referentials:**\n{listing}\n",
+            summary,
+        )
+
+    def _submit_pull_request(
+        self, branch_name: str, title: str, summary: str, label: str
+    ) -> Optional[str]:
+        """POST a pull request with the standard update body."""
         if not self.github_token:
             print("⚠️  No GitHub token found, skipping PR creation")
             return None
@@ -173,13 +361,12 @@ class ReferentialUpdater:
         )
 
         pr_data = {
-            "title": f"feat(referential): update {referential_name} to v{version}",
+            "title": title,
             "head": branch_name,
             "base": "main",
             "body": f"""## Automated Referential Update
 
-**Referential:** {referential_name}
-**Version:** {version}
+{summary}
 **Date:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 ### Changes Detected
@@ -197,15 +384,11 @@ This PR was automatically generated by the EBIOS RM referential update system.
 """,
         }
 
-        headers = {
-            "Authorization": f"token {self.github_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json",
-        }
-
         if not self.dry_run:
             try:
-                response = requests.post(api_url, json=pr_data, headers=headers)
+                response = self.session.post(
+                    api_url, json=pr_data, headers=self._pr_headers, timeout=(5, 30)
+                )
                 response.raise_for_status()
 
                 pr_url = response.json().get("html_url")
@@ -215,7 +398,7 @@ This PR was automatically generated by the EBIOS RM referential update system.
                 print(f"❌ Failed to create PR: {e}")
                 return None
         else:
-            print(f"🔄 [DRY RUN] Would create PR for {referential_name} v{version}")
+            print(f"🔄 [DRY RUN] Would create PR for {label}")
             return f"https://github.com/{self.repo_owner}/{self.repo_name}/pulls/[simulated]"
 
     def create_version_tag(self, referential_name: str, version: str) -> None:
@@ -239,12 +422,16 @@ This PR was automatically generated by the EBIOS RM referential update system.
         new_files, updated_checksums = self.scan_referentials()
 
         if not new_files:
+            # Keep refreshed stats so the next scan can skip unchanged files
+            self.save_file_stats()
             print("✅ No changes detected")
             return
 
         print(f"📝 Detected changes in: {', '.join(new_files)}")
 
-        # Process each changed referential
+        # Collect each changed referential once
+        updates = []
+        changed_files = []
         processed_refs = set()
         for file_name in new_files:
             # Extract referential name and version from filename
@@ -256,16 +443,27 @@ This PR was automatically generated by the EBIOS RM referential update system.
                 ref_name = base_name
                 version = datetime.now().strftime("%Y-%m-%d")
 
+            changed_files.append(self.referentials_dir / file_name)
             if ref_name in processed_refs:
                 continue
             processed_refs.add(ref_name)
+            updates.append((ref_name, version))
 
-            # Create branch and commit changes
+        if len(updates) == 1:
+            ref_name, version = updates[0]
             branch_name = self.create_update_branch(ref_name)
             if branch_name:
                 self.commit_changes(ref_name, version)
                 self.create_pull_request(branch_name, ref_name, version)
                 self.create_version_tag(ref_name, version)
+        else:
+            # Several referentials changed: one branch, commit and PR for all
+            branch_name = self.create_update_branch("batch")
+            if branch_name:
+                self.commit_batch_changes(updates, changed_files)
+                self.create_batch_pull_request(branch_name, updates)
+                for ref_name, version in updates:
+                    self.create_version_tag(ref_name, version)
 
         # Update manifest
         self.save_manifest(updated_checksums)
@@ -5,12 +5,41 @@ Lit les paramètres depuis les fichiers de config et les applique aux templates.
 
 import yaml
 import json
+from functools import wraps
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import logging
 
+# Utilise le parseur C de libyaml quand PyYAML a été compilé avec
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # accélération optionnelle, voir l'extra "fast"
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _cached_view(method):
+    """Mémorise une vue dérivée de la configuration jusqu'à sa modification.
+
+    Le cache est vidé par ``load_config`` et ``update_scale`` ; les listes et
+    dictionnaires retournés sont partagés et ne doivent pas être modifiés.
+    """
+    @wraps(method)
+    def wrapper(self):
+        name = method.__name__
+        if name not in self._views:
+            self._views[name] = method(self)
+        return self._views[name]
+
+    return wrapper
+
+
 class EBIOSConfigManager:
     """Gestionnaire centralisé de la configuration EBIOS RM."""
     
@@ -18,14 +47,16 @@ class EBIOSConfigManager:
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "config_ebios.yaml"
         self.config_data = {}
+        self._views: Dict[str, Any] = {}
         
         self.load_config()
     
     def load_config(self) -> None:
         """Charge la configuration depuis le fichier YAML."""
+        self._views.clear()
         if self.config_file.exists():
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config_data = yaml.safe_load(f) or {}
+                self.config_data = yaml.load(f, Loader=_YamlLoader) or {}
             logger.info(f"Configuration chargée depuis {self.config_file}")
         else:
             logger.warning(f"Fichier de configuration non trouvé : {self.config_file}")
@@ -38,6 +69,7 @@ class EBIOSConfigManager:
             yaml.dump(self.config_data, f, default_flow_style=False, allow_unicode=True)
         logger.info(f"Configuration sauvegardée dans {self.config_file}")
     
+    @_cached_view
     def get_gravity_scale(self) -> List[Dict[str, Any]]:
         """Retourne l'échelle de gravité configurée."""
         echelles = self.config_data.get('echelles', {})
@@ -53,6 +85,7 @@ class EBIOSConfigManager:
             for level_id, data in gravite.items()
         ]
     
+    @_cached_view
     def get_likelihood_scale(self) -> List[Dict[str, Any]]:
         """Retourne l'échelle de vraisemblance configurée."""
         echelles = self.config_data.get('echelles', {})
@@ -68,6 +101,7 @@ class EBIOSConfigManager:
             for level_id, data in vraisemblance.items()
         ]
     
+    @_cached_view
     def get_risk_sources(self) -> List[Dict[str, str]]:
         """Retourne les sources de risque configurées."""
         sources = self.config_data.get('sources_risque', {})
@@ -89,6 +123,7 @@ class EBIOSConfigManager:
         
         return risk_sources
     
+    @_cached_view
     def get_strategic_scenarios(self) -> List[Dict[str, str]]:
         """Retourne les scénarios stratégiques configurés."""
         scenarios = self.config_data.get('scenarios_strategiques', {})
@@ -108,6 +143,7 @@ class EBIOSConfigManager:
         
         return strategic_scenarios
     
+    @_cached_view
     def get_operational_scenarios(self) -> List[Dict[str, str]]:
         """Retourne les scénarios opérationnels configurés."""
         vecteurs = self.config_data.get('vecteurs_attaque', {})
@@ -133,6 +169,7 @@ class EBIOSConfigManager:
             'seuils': {'acceptable': [1,2,3], 'attention': [4,6,8], 'critique': [9,12,16]}
         })
     
+    @_cached_view
     def get_export_colors(self) -> Dict[str, str]:
         """Retourne les couleurs d'export configurées."""
         export_config = self.config_data.get('export', {})
@@ -157,6 +194,7 @@ class EBIOSConfigManager:
             self.config_data['echelles'][scale_type] = {'niveaux': {}}
         
         self.config_data['echelles'][scale_type]['niveaux'][level_id] = data
+        self._views.clear()
         logger.info(f"Échelle {scale_type} niveau {level_id} mise à jour")
     
     def add_risk_source(self, source_data: Dict[str, str]) -> None:
@@ -166,8 +204,17 @@ class EBIOSConfigManager:
     
     def export_to_json(self, output_path: Path) -> None:
         """Exporte la configuration en JSON."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Les clés de niveaux sont des entiers, convertis en texte comme json.dump
+            Path(output_path).write_bytes(
+                orjson.dumps(
+                    self.config_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            )
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
         logger.info(f"Configuration exportée en JSON : {output_path}")
     
     def _get_default_config(self) -> Dict[str, Any]:
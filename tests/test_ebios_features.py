@@ -68,6 +68,59 @@ class TestEBIOSRMFeatures:
         except Exception as e:
             pytest.skip(f"Excel export feature not fully implemented: {e}")
 
+    def test_atelier3_scores_are_values(self, tmp_path):
+        """Test Atelier 3 risk scores and priorities are written as values."""
+        from openpyxl import load_workbook
+
+        from ebiosrm_core.exporters import export_excel
+
+        test_data = {
+            "threats": [
+                {
+                    "sr_id": "SR001",
+                    "ov_id": "OV001",
+                    "strategic_path": "Test Attack",
+                    "operational_steps": "Step1:Medium",
+                    "risk_sources": ["RS001"],
+                    "targeted_objectives": [],
+                }
+            ],
+        }
+
+        output_file = tmp_path / "scores.xlsx"
+        export_excel(test_data, output_file)
+
+        ws = load_workbook(output_file)["Atelier3_Scenarios"]
+        assert ws["B2"].value == "RS001"
+        assert ws["C2"].value is None
+        assert ws["G2"].value == "Occasional"
+        assert ws["H2"].value == 6
+        assert ws["I2"].value == "Élevé"
+
+        # The fixed levels are not offered as dropdowns
+        validated = {str(dv.sqref) for dv in ws.data_validations.dataValidation}
+        assert not any(ref.startswith(("F", "G")) for ref in validated)
+
+        # Formatting stops where the table does
+        formatted = {str(cf.sqref) for cf in ws.conditional_formatting}
+        assert formatted == {"I2:I20"}
+
+    def test_exporters_defined_once(self):
+        """Test each exporter has a single definition in the module."""
+        import ast
+        from collections import Counter
+
+        from ebiosrm_core import exporters
+
+        tree = ast.parse(Path(exporters.__file__).read_text(encoding="utf-8"))
+        counts = Counter(
+            node.name for node in tree.body if isinstance(node, ast.FunctionDef)
+        )
+
+        for name in ("export_json", "export_markdown", "export_excel"):
+            assert counts[name] == 1, f"{name} is defined {counts[name]} times"
+        assert exporters.export_excel.__qualname__ == "export_excel"
+
 
 class TestOpenpyxlCompatibility:
     """Test openpyxl API compatibility."""
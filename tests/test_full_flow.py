@@ -56,6 +56,132 @@ class TestDataLoading:
         with pytest.raises(ValueError, match="Missing columns"):
             loader.load_all(config_dir)
 
+    def test_load_all_cached_invalidates_on_edit(self, tmp_path):
+        """Test memoized loading is reused until a config file changes."""
+        import os
+
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        assets_file = config_dir / "assets.csv"
+        assets_file.write_text(
+            "id,type,label,criticality\nA001,Data,DB,High\n", encoding="utf-8"
+        )
+        (config_dir / "threats.csv").write_text(
+            "sr_id,ov_id,strategic_path,operational_steps\n", encoding="utf-8"
+        )
+
+        first_assets = loader.load_all_cached(config_dir)[0]
+        assert loader.load_all_cached(config_dir)[0] is first_assets
+
+        assets_file.write_text(
+            "id,type,label,criticality\nA001,Data,DB,High\nA002,System,Web,Low\n",
+            encoding="utf-8",
+        )
+        stat = assets_file.stat()
+        os.utime(assets_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert len(loader.load_all_cached(config_dir)[0]) == 2
+
+    def test_load_all_cached_invalidates_on_removal(self, tmp_path):
+        """Test removing an optional config file invalidates the cache."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "assets.csv").write_text(
+            "id,type,label,criticality\nA001,Data,DB,High\n", encoding="utf-8"
+        )
+        (config_dir / "threats.csv").write_text(
+            "sr_id,ov_id,strategic_path,operational_steps\n", encoding="utf-8"
+        )
+        measures_file = config_dir / "measures.csv"
+        measures_file.write_text(
+            "id,label,type,description,effectiveness,implementation_cost,"
+            "responsible_stakeholder\nM001,MFA,Preventive,Desc,High,Low,S001\n",
+            encoding="utf-8",
+        )
+
+        assert len(loader.load_all_cached(config_dir)[6]) == 1
+
+        measures_file.unlink()
+
+        assert loader.load_all_cached(config_dir)[6] == []
+
+    def test_load_all_with_report_lists_duplicate_ids(self, tmp_path):
+        """Test duplicate IDs are reported once each while parsing."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "assets.csv").write_text(
+            "id,type,label,criticality\n"
+            "A001,Data,DB,High\nA001,Data,DB copy,Low\nA001,Data,DB 3,Low\n",
+            encoding="utf-8",
+        )
+        (config_dir / "threats.csv").write_text(
+            "sr_id,ov_id,strategic_path,operational_steps\n", encoding="utf-8"
+        )
+
+        *data, dup_report = loader.load_all_with_report(config_dir)
+
+        assert len(data[0]) == 3
+        assert dup_report == {"asset": ["A001"], "threat": [], "objective": []}
+
+    def test_load_settings_reloads_on_edit(self, tmp_path):
+        """Test cached settings are re-read when the YAML file changes."""
+        settings_file = tmp_path / "settings.yaml"
+        settings_file.write_text("output_dir: first\n", encoding="utf-8")
+
+        settings = loader.load_settings(tmp_path)
+        settings.output_dir = "mutated/"
+        assert loader.load_settings(tmp_path).output_dir == "first/"
+
+        settings_file.write_text("output_dir: second/path\n", encoding="utf-8")
+
+        assert loader.load_settings(tmp_path).output_dir == "second/path/"
+
+    def test_load_referentials_keeps_highest_version(self, tmp_path):
+        """Test referential versions stay text and the newest one wins."""
+        referentials_dir = tmp_path / "referentials"
+        referentials_dir.mkdir()
+        header = "id,label,category,description,criticality,version\n"
+        (referentials_dir / "REF_v2023-01-01.csv").write_text(
+            header + "R001,Old,Cat,Desc,Low,2023-01-01\n", encoding="utf-8"
+        )
+        (referentials_dir / "REF_v2024-01-01.csv").write_text(
+            header + "R001,New,Cat,Desc,High,2024-01-01\n", encoding="utf-8"
+        )
+
+        df = loader.load_referentials(tmp_path)
+
+        assert df["label"].tolist() == ["New"]
+        assert df["version"].tolist() == ["2024-01-01"]
+        assert df["source_file"].tolist() == ["REF_v2024-01-01.csv"]
+
+    def test_load_referentials_compares_versions_numerically(self, tmp_path):
+        """Test version 10.0 of a control wins over version 2.0."""
+        referentials_dir = tmp_path / "referentials"
+        referentials_dir.mkdir()
+        (referentials_dir / "REF.csv").write_text(
+            "id,label,version\nR001,Second,2.0\nR001,Tenth,10.0\nR002,Only,1.0\n",
+            encoding="utf-8",
+        )
+
+        df = loader.load_referentials(tmp_path)
+
+        labels = df.set_index("id")["label"].to_dict()
+        assert labels == {"R001": "Tenth", "R002": "Only"}
+
+    def test_load_referentials_drops_unknown_columns(self, tmp_path):
+        """Test only the referential columns are kept from each file."""
+        referentials_dir = tmp_path / "referentials"
+        referentials_dir.mkdir()
+        (referentials_dir / "REF_v1.csv").write_text(
+            "notes,id,label\nfree text,R001,Control\n", encoding="utf-8"
+        )
+
+        df = loader.load_referentials(tmp_path)
+
+        assert "notes" not in df.columns
+        assert df.loc[0, "version"] == "1"
+        assert df.loc[0, "xref_iso"] == ""
+
 
 class TestModels:
     """Test Pydantic models and business logic."""
@@ -95,6 +221,55 @@ class TestModels:
         risk_level = threat.risk_level(max_asset_severity=4)
         assert risk_level == "Critical"
 
+    def test_threat_risk_vector_matches_scalar(self):
+        """Test the batched risk lookup agrees with per-threat scoring."""
+        threats = [
+            Threat(
+                sr_id=f"SR00{i}",
+                ov_id=f"OV00{i}",
+                strategic_path="Test",
+                operational_steps=steps,
+            )
+            for i, steps in enumerate(
+                ["Step1:Low", "Step1:Medium,Step2:High", "Step1:Critical", "Step1:?"]
+            )
+        ]
+
+        for severity in range(1, 5):
+            expected = [threat.risk_level(severity) for threat in threats]
+            assert Threat.risk_vector(threats, severity).tolist() == expected
+
+    def test_risk_codes_numba_matches_numpy(self):
+        """Test the Numba risk lookup agrees with the NumPy fallback."""
+        pytest.importorskip("numba")
+        import numpy as np
+
+        from ebiosrm_core._kernels import _risk_codes_numpy
+        from ebiosrm_core._numba_kernels import _risk_codes_numba
+        from ebiosrm_core.models import _RISK_CODES
+
+        likelihoods = np.array([1.0, 1.5, 2.0, 2.75, 3.0, 4.0, 4.0])
+        for sev_idx in range(4):
+            np.testing.assert_array_equal(
+                _risk_codes_numba(likelihoods, sev_idx, _RISK_CODES),
+                _risk_codes_numpy(likelihoods, sev_idx, _RISK_CODES),
+            )
+
+    def test_step_means_numba_matches_numpy(self):
+        """Test the Numba step averaging agrees with the NumPy fallback."""
+        pytest.importorskip("numba")
+        import numpy as np
+
+        from ebiosrm_core._kernels import _step_means_numpy
+        from ebiosrm_core._numba_kernels import _step_means_numba
+
+        padded = np.array([[1, 3, -1], [2, -1, -1], [-1, -1, -1], [4, 4, 4]], np.int8)
+        empty = np.full((3, 0), -1, dtype=np.int8)
+        for step_codes in (padded, empty):
+            np.testing.assert_array_equal(
+                _step_means_numba(step_codes), _step_means_numpy(step_codes)
+            )
+
     def test_invalid_threat_steps_format(self):
         """Test validation of operational steps format."""
         with pytest.raises(ValidationError, match="operational_steps must contain"):
@@ -126,6 +301,39 @@ class TestRiskCalculation:
             result["max_severity"] == expected_max_severity for result in results
         )
 
+    def test_risk_columns_match_rows(self):
+        """Test the columnar results line up with the per-threat dicts."""
+        assets = [
+            Asset(id="A1", type="Data", label="DB", criticality="High"),
+            Asset(id="A2", type="System", label="Web", criticality="Low"),
+        ]
+        threats = [
+            Threat(
+                sr_id=f"SR00{i}",
+                ov_id=f"OV00{i}",
+                strategic_path="Test",
+                operational_steps=steps,
+            )
+            for i, steps in enumerate(["Step1:Low", "Step1:High,Step2:Critical"])
+        ]
+
+        columns = generator.calculate_risk_columns(assets, threats)
+        rows = generator.calculate_risk_levels(assets, threats)
+
+        assert [row["risk_level"] for row in rows] == list(columns["risk_level"])
+        assert rows[1] == {
+            "threat_id": "SR001",
+            "threat_ov": "OV001",
+            "strategic_path": "Test",
+            "operational_steps": "Step1:High,Step2:Critical",
+            "likelihood_score": 3.5,
+            "max_severity": 3,
+            "severity_score": 3,
+            "risk_level": "High",
+            "affected_assets": ("A1", "A2"),
+        }
+        assert generator.calculate_risk_levels(assets, []) == []
+
 
 class TestExporters:
     """Test export functionality."""
@@ -186,6 +394,35 @@ class TestExporters:
         assert output_file.suffix == ".xlsx"
 
 
+    def test_markdown_export_tallies_risk_iterator(self, tmp_path):
+        """Test the Markdown export counts risks streamed from the generator."""
+        from ebiosrm_core import exporters
+
+        assets = [Asset(id="A1", type="Data", label="Test", criticality="High")]
+        threats = [
+            Threat(
+                sr_id=f"SR00{i}",
+                ov_id=f"OV00{i}",
+                strategic_path="Test",
+                operational_steps=steps,
+            )
+            for i, steps in enumerate(["Step1:Low", "Step1:High", "Step1:High"])
+        ]
+        expected = generator.calculate_risk_levels(assets, threats)
+
+        output_file = tmp_path / "report.md"
+        exporters.export_markdown(
+            {"risk_results": generator.iter_risk_levels(assets, threats)},
+            output_file,
+        )
+        content = output_file.read_text(encoding="utf-8")
+        for level in {risk["risk_level"] for risk in expected}:
+            count = sum(risk["risk_level"] == level for risk in expected)
+            assert f"| {level} | {count} |" in content
+
+        exporters.export_markdown({"risk_results": iter([])}, output_file)
+        assert "| Risk Level |" not in output_file.read_text(encoding="utf-8")
+
 class TestFullWorkflow:
     """Test complete end-to-end workflow."""
 